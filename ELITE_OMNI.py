@@ -162,6 +162,7 @@ class EliteOmniPipeline:
         print("="*70)
         
         assembler = OmniAssembler(str(opal_dir))
+        assembler.describe()
         
         # Analyze first
         analysis = assembler.analyze_clips()
@@ -0,0 +1,33 @@
+"""
+JSON HELPERS
+Shared by the engines: orjson when installed, stdlib json otherwise.
+Both paths emit UTF-8 JSON bytes that the other reads back.
+"""
+
+import json
+from typing import Any, Callable, Optional, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def loads(raw: Union[bytes, str]) -> Any:
+    """Decode JSON bytes or text."""
+    return orjson.loads(raw) if orjson else json.loads(raw)
+
+
+def dumps(
+    obj: Any,
+    pretty: bool = False,
+    default: Optional[Callable[[Any], Any]] = None
+) -> bytes:
+    """
+    Encode as UTF-8 JSON bytes. pretty indents by two spaces; default
+    converts values JSON can't represent (e.g. str for datetimes).
+    """
+    if orjson:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(obj, default=default, option=option)
+    return json.dumps(obj, indent=2 if pretty else None, default=default).encode("utf-8")
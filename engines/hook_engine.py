@@ -4,8 +4,6 @@ Creates Hollywood-style hook overlays for first 0-3 seconds.
 """
 
 import os
-import random
-import httpx
 from pathlib import Path
 from typing import Dict, List
 
@@ -23,6 +21,7 @@ The hook should be 3-6 words MAX, create curiosity, sound like expert authority.
 Examples: "The math doesn't lie", "Banks hate this truth", "Nobody talks about this"
 Return ONLY the hook text."""
     try:
+        import httpx
         async with httpx.AsyncClient(timeout=30) as client:
             response = await client.post("https://api.groq.com/openai/v1/chat/completions",
                 headers={"Authorization": f"Bearer {GROQ_API_KEY}", "Content-Type": "application/json"},
@@ -30,6 +29,7 @@ Return ONLY the hook text."""
             if response.status_code == 200:
                 return response.json()["choices"][0]["message"]["content"].strip().strip('"\'')
     except: pass
+    import random
     return random.choice(["The truth about money", "What they won't tell you", "This changes everything"])
 
 
@@ -9,11 +9,40 @@ Uses FREE APIs only.
 """
 
 import os
-import json
 import asyncio
-from datetime import datetime, timedelta
+import functools
+import heapq
+import io
+import itertools
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
 from typing import Optional
-import httpx
+
+import numpy as np
+
+# XML parser is fixed at import: lxml when installed, stdlib ElementTree otherwise
+try:
+    from lxml import etree as _lxml_etree
+except ImportError:
+    _lxml_etree = None
+    import xml.etree.ElementTree as _stdlib_etree
+
+# Clark-notation tag avoids a namespace-map lookup per item
+_TRENDS_TRAFFIC_TAG = "{https://trends.google.com/trends/trendingsearches/daily}approx_traffic"
+
+try:
+    from engines._json import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # Run as a script from engines/
+    from _json import dumps as _json_dumps, loads as _json_loads
+
+
+@functools.cache
+def _httpx():
+    """Import httpx on first use so CLI cold-start skips the network stack"""
+    import httpx
+    return httpx
+
 
 # ============================================================
 # CONFIGURATION
@@ -46,6 +75,14 @@ class HunterConfig:
         "survival": ["emergency preparedness", "self reliance skills", "survival tips"]
     }
     
+    # Sources scanned by a full hunt
+    SUBREDDITS = (
+        "entrepreneur", "passive_income", "sidehustle",
+        "financialindependence", "beermoney", "WorkOnline"
+    )
+    NEWS_CATEGORIES = ("business", "technology")
+    AFFILIATE_HUNT_NICHES = ("software", "finance", "health")
+    
     # Minimum engagement threshold
     MIN_ENGAGEMENT_SCORE = 50
     
@@ -60,6 +97,16 @@ class HunterConfig:
     BACKOFF_MINUTES = 30
 
 
+# Title keyword groups (hoisted so no list is rebuilt per post/article)
+CONTENT_ANGLE_KEYWORDS = (
+    (("how", "guide", "tutorial"), "tutorial"),
+    (("best", "top", "worst"), "listicle"),
+    (("story", "happened", "experience"), "story"),
+)
+NEWS_MONEY_KEYWORDS = frozenset({"money", "income", "wealth", "invest", "save", "earn", "profit"})
+NEWS_TREND_KEYWORDS = frozenset({"ai", "crypto", "tech", "breakthrough", "new", "2025"})
+
+
 # ============================================================
 # CIRCUIT BREAKER (Prevents cascading failures)
 # ============================================================
@@ -107,6 +154,40 @@ class CircuitBreaker:
         return False
 
 
+# ============================================================
+# TTL CACHE (Skips repeat API calls inside the refresh window)
+# ============================================================
+
+class TTLCache:
+    """Tiny in-process LRU cache: {key: (expires_at, value)}, at most max_size keys"""
+    
+    def __init__(self, max_size: int = 256):
+        self.max_size = max_size
+        self._store = OrderedDict()
+    
+    def get(self, key):
+        """Return cached value, or None if missing/expired"""
+        hit = self._store.get(key)
+        if hit is None:
+            return None
+        if hit[0] <= time.monotonic():
+            del self._store[key]
+            return None
+        self._store.move_to_end(key)
+        return hit[1]
+    
+    def set(self, key, value, ttl: float):
+        """Store value for ttl seconds, evicting expired then least-recent keys"""
+        now = time.monotonic()
+        self._store[key] = (now + ttl, value)
+        self._store.move_to_end(key)
+        if len(self._store) > self.max_size:
+            for stale in [k for k, (expires, _) in self._store.items() if expires <= now]:
+                del self._store[stale]
+            while len(self._store) > self.max_size:
+                self._store.popitem(last=False)
+
+
 # ============================================================
 # REDDIT HUNTER - FREE API
 # ============================================================
@@ -129,8 +210,8 @@ class RedditHunter:
             print("[HUNTER] Reddit credentials not configured")
             return False
             
-        async with httpx.AsyncClient() as client:
-            auth = httpx.BasicAuth(self.client_id, self.client_secret)
+        async with _httpx().AsyncClient() as client:
+            auth = _httpx().BasicAuth(self.client_id, self.client_secret)
             response = await client.post(
                 "https://www.reddit.com/api/v1/access_token",
                 auth=auth,
@@ -154,7 +235,7 @@ class RedditHunter:
             
         opportunities = []
         
-        async with httpx.AsyncClient() as client:
+        async with _httpx().AsyncClient() as client:
             headers = {
                 "Authorization": f"Bearer {self.access_token}",
                 "User-Agent": self.user_agent
@@ -170,6 +251,7 @@ class RedditHunter:
             if response.status_code == 200:
                 data = response.json()
                 posts = data.get("data", {}).get("children", [])
+                now_iso = datetime.now(timezone.utc).isoformat()
                 
                 for post in posts:
                     post_data = post.get("data", {})
@@ -187,7 +269,7 @@ class RedditHunter:
                             "url": f"https://reddit.com{post_data.get('permalink')}",
                             "opportunity_score": score,
                             "content_angle": self._extract_content_angle(post_data),
-                            "timestamp": datetime.utcnow().isoformat()
+                            "timestamp": now_iso
                         })
         
         return sorted(opportunities, key=lambda x: x["opportunity_score"], reverse=True)
@@ -213,14 +295,11 @@ class RedditHunter:
         # Identify content type
         if "?" in title:
             return "answer_question"
-        elif any(word in title.lower() for word in ["how", "guide", "tutorial"]):
-            return "tutorial"
-        elif any(word in title.lower() for word in ["best", "top", "worst"]):
-            return "listicle"
-        elif any(word in title.lower() for word in ["story", "happened", "experience"]):
-            return "story"
-        else:
-            return "commentary"
+        title_lower = title.lower()
+        for words, angle in CONTENT_ANGLE_KEYWORDS:
+            if any(word in title_lower for word in words):
+                return angle
+        return "commentary"
     
     async def hunt_multiple(self, subreddits: list) -> list:
         """Hunt across multiple subreddits"""
@@ -232,7 +311,7 @@ class RedditHunter:
                 all_opportunities.extend(opportunities)
             except Exception as e:
                 print(f"[HUNTER] Error hunting r/{subreddit}: {e}")
-                
+        
         return sorted(all_opportunities, key=lambda x: x["opportunity_score"], reverse=True)
 
 
@@ -247,10 +326,13 @@ class NewsHunter:
     Circuit breaker enabled.
     """
     
+    HEADLINES_TTL = 600  # seconds
+    
     def __init__(self):
         self.api_key = os.getenv("NEWSAPI_KEY")
         self.base_url = "https://newsapi.org/v2"
         self.circuit_breaker = CircuitBreaker("NewsAPI", max_failures=3, reset_minutes=60)
+        self._cache = TTLCache()
         
     async def get_top_headlines(self, category: str = "business", country: str = "us") -> list:
         """Get top headlines for opportunity identification"""
@@ -258,6 +340,10 @@ class NewsHunter:
             print("[HUNTER] NewsAPI key not configured")
             return []
         
+        cache_key = (category, country)
+        if (cached := self._cache.get(cache_key)) is not None:
+            return list(cached)
+        
         # Check circuit breaker
         if not self.circuit_breaker.can_execute():
             print("[HUNTER] NewsAPI circuit breaker OPEN - skipping")
@@ -266,7 +352,7 @@ class NewsHunter:
         opportunities = []
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _httpx().AsyncClient(timeout=30.0) as client:
                 response = await client.get(
                     f"{self.base_url}/top-headlines",
                     params={
@@ -279,32 +365,31 @@ class NewsHunter:
                 
                 if response.status_code == 200:
                     self.circuit_breaker.record_success()
-                    data = response.json()
+                    data = _json_loads(response.content)
                     for article in data.get("articles", []):
                         # Calculate opportunity score based on engagement signals
                         score = 50  # Base score
-                        title = article.get("title", "")
+                        title = article.get("title") or ""
+                        title_lower = title.lower()
                         
                         # Boost for money-related keywords
-                        money_keywords = ["money", "income", "wealth", "invest", "save", "earn", "profit"]
-                    if any(kw in title.lower() for kw in money_keywords):
-                        score += 20
-                    
-                    # Boost for trending topics
-                    trend_keywords = ["ai", "crypto", "tech", "breakthrough", "new", "2025"]
-                    if any(kw in title.lower() for kw in trend_keywords):
-                        score += 15
+                        if any(kw in title_lower for kw in NEWS_MONEY_KEYWORDS):
+                            score += 20
                         
-                    opportunities.append({
-                        "source": "news",
-                        "title": title,
-                        "description": article.get("description", ""),
-                        "url": article.get("url", ""),
-                        "published": article.get("publishedAt", ""),
-                        "source_name": article.get("source", {}).get("name", ""),
-                        "opportunity_score": score,
-                        "content_angle": f"News: {title[:50]}..."
-                    })
+                        # Boost for trending topics
+                        if any(kw in title_lower for kw in NEWS_TREND_KEYWORDS):
+                            score += 15
+                            
+                        opportunities.append({
+                            "source": "news",
+                            "title": title,
+                            "description": article.get("description", ""),
+                            "url": article.get("url", ""),
+                            "published": article.get("publishedAt", ""),
+                            "source_name": article.get("source", {}).get("name", ""),
+                            "opportunity_score": score,
+                            "content_angle": f"News: {title[:50]}..."
+                        })
                 else:
                     self.circuit_breaker.record_failure()
                     print(f"[HUNTER] NewsAPI error: {response.status_code}")
@@ -313,7 +398,10 @@ class NewsHunter:
             self.circuit_breaker.record_failure()
             print(f"[HUNTER] NewsAPI exception: {e}")
                 
-        return sorted(opportunities, key=lambda x: x["opportunity_score"], reverse=True)[:10]
+        top = heapq.nlargest(10, opportunities, key=lambda x: x["opportunity_score"])
+        if top:
+            self._cache.set(cache_key, top, self.HEADLINES_TTL)
+        return list(top)
     
     async def search_topic(self, query: str) -> list:
         """Search for news on a specific topic"""
@@ -323,7 +411,7 @@ class NewsHunter:
         opportunities = []
         
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
+            async with _httpx().AsyncClient(timeout=30.0) as client:
                 response = await client.get(
                     f"{self.base_url}/everything",
                     params={
@@ -353,152 +441,324 @@ class NewsHunter:
         return opportunities
 
 
+# ============================================================
+# SHARED HTTP CLIENT (keep-alive + HTTP/2 across calls)
+# ============================================================
+
+class SharedClientMixin:
+    """Lazily-created httpx.AsyncClient reused across every call of a hunter"""
+    
+    _client = None
+    
+    async def _get_client(self):
+        """Return the shared client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            httpx = _httpx()
+            self._client = httpx.AsyncClient(
+                http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+                timeout=10.0,
+                headers={"Accept-Encoding": "gzip, deflate"}
+            )
+        return self._client
+    
+    async def aclose(self):
+        """Close the shared client (call on shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
 # ============================================================
 # GOOGLE TRENDS HUNTER - FREE (NO API KEY)
 # ============================================================
 
-class GoogleTrendsHunter:
+class GoogleTrendsHunter(SharedClientMixin):
     """
     Hunts rising search trends using Google Trends.
     FREE: No API key required, rate limited.
     """
     
+    TREND_TTL = 300  # seconds
+    
+    def __init__(self):
+        self._client = None
+        self._cache = TTLCache()
+    
     async def get_trending_searches(self, geo: str = "US") -> list:
         """Get daily trending searches"""
-        # Using the public RSS feed (free, no auth)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"https://trends.google.com/trending/rss?geo={geo}"
-            )
-            
-            if response.status_code == 200:
-                # Parse RSS (simplified)
-                trends = self._parse_trends_rss(response.text)
-                return trends
+        if (cached := self._cache.get((geo,))) is not None:
+            return list(cached)
         
-        return []
+        # Using the public RSS feed (free, no auth)
+        client = await self._get_client()
+        async with client.stream(
+            "GET", f"https://trends.google.com/trending/rss?geo={geo}"
+        ) as response:
+            if response.status_code != 200:
+                return []
+            # Raw (gunzipped) bytes go straight to the XML parser - no str decode
+            content = await response.aread()
+        
+        # Parse RSS (simplified)
+        trends = self._parse_trends_rss(content)
+        if trends:
+            self._cache.set((geo,), trends, self.TREND_TTL)
+        return list(trends)
     
-    def _parse_trends_rss(self, rss_content: str) -> list:
+    def _parse_trends_rss(self, rss_content) -> list:
         """Parse Google Trends RSS feed"""
-        import xml.etree.ElementTree as ET
+        if _lxml_etree is not None:
+            return self._iterparse_trends_rss(rss_content)
         
         trends = []
         try:
-            root = ET.fromstring(rss_content)
+            root = _stdlib_etree.fromstring(rss_content)
             items = root.findall(".//item")
+            now_iso = datetime.now(timezone.utc).isoformat()
             
             for item in items[:20]:  # Top 20 trends
                 title = item.find("title")
-                traffic = item.find("ht:approx_traffic", 
-                    {"ht": "https://trends.google.com/trends/trendingsearches/daily"})
+                traffic = item.find(_TRENDS_TRAFFIC_TAG)
                 
                 if title is not None:
                     trends.append({
                         "source": "google_trends",
                         "keyword": title.text,
                         "traffic": traffic.text if traffic is not None else "Unknown",
-                        "timestamp": datetime.utcnow().isoformat()
+                        "timestamp": now_iso
                     })
         except Exception as e:
             print(f"[HUNTER] Error parsing trends: {e}")
             
         return trends
+    
+    def _iterparse_trends_rss(self, rss_content) -> list:
+        """Stream-parse the RSS with lxml, stopping after the top 20 items"""
+        if isinstance(rss_content, str):
+            rss_content = rss_content.encode("utf-8")
+        
+        trends = []
+        now_iso = datetime.now(timezone.utc).isoformat()
+        try:
+            context = _lxml_etree.iterparse(
+                io.BytesIO(rss_content), events=("end",), tag="item"
+            )
+            for _, item in context:
+                title = item.find("title")
+                traffic = item.find(_TRENDS_TRAFFIC_TAG)
+                
+                if title is not None:
+                    trends.append({
+                        "source": "google_trends",
+                        "keyword": title.text,
+                        "traffic": traffic.text if traffic is not None else "Unknown",
+                        "timestamp": now_iso
+                    })
+                
+                # Free parsed nodes so memory stays bounded
+                item.clear()
+                while item.getprevious() is not None:
+                    del item.getparent()[0]
+                
+                if len(trends) >= 20:  # Top 20 trends
+                    break
+        except Exception as e:
+            print(f"[HUNTER] Error parsing trends: {e}")
+        
+        return trends
 
 
 # ============================================================
 # YOUTUBE TRENDS HUNTER - FREE API
 # ============================================================
 
-class YouTubeHunter:
+class YouTubeHunter(SharedClientMixin):
     """
     Hunts trending videos and gaps in YouTube.
     FREE: 10,000 quota units/day.
     """
     
+    STATS_TTL = 1800  # seconds - conserves daily quota
+    MAX_IDS_PER_CALL = 50  # videos.list id limit
+    
     def __init__(self):
         self.api_key = os.getenv("GOOGLE_API_KEY")
         self.base_url = "https://www.googleapis.com/youtube/v3"
+        self._client = None
+        self._cache = TTLCache()
         
     async def search_niche(self, query: str, max_results: int = 10) -> list:
         """Search for videos in a niche to find gaps"""
         if not self.api_key:
             print("[HUNTER] YouTube API key not configured")
             return []
-            
+        
+        videos = await self._search_only(query, max_results)
+        
+        # Get video statistics
+        stats = await self._get_video_stats([v["id"]["videoId"] for v in videos])
+        
+        return self._build_opportunities(videos, stats)
+    
+    async def search_niches(self, queries: list, max_results: int = 10) -> list:
+        """
+        Search several niches with one shared stats lookup.
+        N searches + 1 videos.list call instead of N + N.
+        """
+        if not self.api_key:
+            print("[HUNTER] YouTube API key not configured")
+            return []
+        
+        search_results = await asyncio.gather(
+            *[self._search_only(q, max_results) for q in queries],
+            return_exceptions=True
+        )
+        
+        # A video ranking in several niches is kept once (first niche wins)
+        seen = set()
+        per_niche = []
+        for query, videos in zip(queries, search_results):
+            if isinstance(videos, Exception):
+                print(f"[HUNTER] YouTube search failed for '{query}': {videos}")
+                continue
+            unique = []
+            for video in videos:
+                video_id = video["id"]["videoId"]
+                if video_id not in seen:
+                    seen.add(video_id)
+                    unique.append(video)
+            per_niche.append(unique)
+        
+        stats = await self._get_video_stats(list(seen))
+        
         opportunities = []
+        for videos in per_niche:
+            opportunities.extend(self._build_opportunities(videos, stats))
+        return opportunities
+    
+    async def _search_only(self, query: str, max_results: int = 10) -> list:
+        """Run the search endpoint and return the raw video items"""
+        client = await self._get_client()
+        # Search for recent videos
+        response = await client.get(
+            f"{self.base_url}/search",
+            params={
+                "key": self.api_key,
+                "q": query,
+                "part": "snippet",
+                "type": "video",
+                "order": "viewCount",
+                "publishedAfter": (datetime.now(timezone.utc) - timedelta(days=7)).strftime("%Y-%m-%dT%H:%M:%SZ"),
+                "maxResults": max_results
+            }
+        )
         
-        async with httpx.AsyncClient() as client:
-            # Search for recent videos
-            response = await client.get(
-                f"{self.base_url}/search",
-                params={
-                    "key": self.api_key,
-                    "q": query,
-                    "part": "snippet",
-                    "type": "video",
-                    "order": "viewCount",
-                    "publishedAfter": (datetime.utcnow() - timedelta(days=7)).isoformat() + "Z",
-                    "maxResults": max_results
-                }
-            )
+        if response.status_code == 200:
+            data = _json_loads(response.content)
+            return data.get("items", [])
+        
+        return []
+    
+    def _build_opportunities(self, videos: list, stats: dict) -> list:
+        """Assemble scored opportunity records from search items + stats map"""
+        video_stats_list = [stats.get(v["id"]["videoId"], {}) for v in videos]
+        scores = self._score_batch(video_stats_list)
+        
+        opportunities = []
+        now_iso = datetime.now(timezone.utc).isoformat()
+        
+        for video, video_stats, score in zip(videos, video_stats_list, scores):
+            video_id = video["id"]["videoId"]
+            snippet = video.get("snippet", {})
             
-            if response.status_code == 200:
-                data = response.json()
-                videos = data.get("items", [])
-                
-                # Get video statistics
-                video_ids = [v["id"]["videoId"] for v in videos]
-                stats = await self._get_video_stats(video_ids)
-                
-                for video in videos:
-                    video_id = video["id"]["videoId"]
-                    snippet = video.get("snippet", {})
-                    video_stats = stats.get(video_id, {})
-                    
-                    opportunities.append({
-                        "source": "youtube",
-                        "title": snippet.get("title"),
-                        "channel": snippet.get("channelTitle"),
-                        "video_id": video_id,
-                        "views": int(video_stats.get("viewCount", 0)),
-                        "likes": int(video_stats.get("likeCount", 0)),
-                        "comments": int(video_stats.get("commentCount", 0)),
-                        "published": snippet.get("publishedAt"),
-                        "opportunity_score": self._calculate_yt_score(video_stats),
-                        "timestamp": datetime.utcnow().isoformat()
-                    })
+            opportunities.append({
+                "source": "youtube",
+                "title": snippet.get("title"),
+                "channel": snippet.get("channelTitle"),
+                "video_id": video_id,
+                "views": video_stats.get("views", 0),
+                "likes": video_stats.get("likes", 0),
+                "comments": video_stats.get("comments", 0),
+                "published": snippet.get("publishedAt"),
+                "opportunity_score": score,
+                "timestamp": now_iso
+            })
         
         return sorted(opportunities, key=lambda x: x["opportunity_score"], reverse=True)
     
+    def _score_batch(self, stats_list: list) -> list:
+        """
+        Score many videos in one vectorized pass.
+        Same formula as _calculate_yt_score.
+        """
+        if not stats_list:
+            return []
+        
+        views = np.fromiter((st.get("views", 0) for st in stats_list), dtype=np.float64, count=len(stats_list))
+        likes = np.fromiter((st.get("likes", 0) for st in stats_list), dtype=np.float64, count=len(stats_list))
+        comments = np.fromiter((st.get("comments", 0) for st in stats_list), dtype=np.float64, count=len(stats_list))
+        
+        # Engagement rate (0 when there are no views)
+        engagement_rate = np.divide(
+            (likes + comments) * 100, views, out=np.zeros_like(views), where=views > 0
+        )
+        # Views velocity (recent views = hot topic)
+        velocity_score = np.minimum(views / 1000, 100)
+        
+        return ((engagement_rate * 10) + velocity_score).tolist()
+    
     async def _get_video_stats(self, video_ids: list) -> dict:
-        """Get statistics for multiple videos"""
+        """
+        Get statistics for multiple videos (50 ids per videos.list call).
+        Returns {video_id: {"views": int, "likes": int, "comments": int}}.
+        """
         if not video_ids:
             return {}
-            
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
+        
+        cache_key = tuple(sorted(video_ids))
+        if (cached := self._cache.get(cache_key)) is not None:
+            return cached
+        
+        chunks = [
+            video_ids[i:i + self.MAX_IDS_PER_CALL]
+            for i in range(0, len(video_ids), self.MAX_IDS_PER_CALL)
+        ]
+        client = await self._get_client()
+        responses = await asyncio.gather(*[
+            client.get(
                 f"{self.base_url}/videos",
                 params={
                     "key": self.api_key,
-                    "id": ",".join(video_ids),
+                    "id": ",".join(chunk),
                     "part": "statistics"
                 }
             )
-            
+            for chunk in chunks
+        ])
+        
+        stats = {}
+        for response in responses:
             if response.status_code == 200:
-                data = response.json()
-                return {
-                    item["id"]: item.get("statistics", {})
-                    for item in data.get("items", [])
-                }
+                data = _json_loads(response.content)
+                for item in data.get("items", []):
+                    raw = item.get("statistics", {})
+                    # Normalize once: the API returns counts as strings
+                    stats[item["id"]] = {
+                        "views": int(raw.get("viewCount", 0) or 0),
+                        "likes": int(raw.get("likeCount", 0) or 0),
+                        "comments": int(raw.get("commentCount", 0) or 0)
+                    }
         
-        return {}
+        if stats:
+            self._cache.set(cache_key, stats, self.STATS_TTL)
+        return stats
     
     def _calculate_yt_score(self, stats: dict) -> float:
-        """Calculate opportunity score for YouTube video"""
-        views = int(stats.get("viewCount", 0))
-        likes = int(stats.get("likeCount", 0))
-        comments = int(stats.get("commentCount", 0))
+        """Calculate opportunity score for YouTube video (normalized int stats)"""
+        views = stats.get("views", 0)
+        likes = stats.get("likes", 0)
+        comments = stats.get("comments", 0)
         
         # Engagement rate
         if views > 0:
@@ -516,6 +776,31 @@ class YouTubeHunter:
 # AFFILIATE OPPORTUNITY HUNTER
 # ============================================================
 
+# High-demand keywords per affiliate niche
+HIGH_DEMAND_KEYWORDS = {
+    "software": ("ai tools", "automation software", "productivity apps"),
+    "finance": ("budgeting apps", "investing for beginners", "side hustle ideas"),
+    "health": ("weight loss supplements", "fitness equipment", "wellness products"),
+    "education": ("online courses", "skill development", "certification programs")
+}
+
+
+@functools.lru_cache(maxsize=64)
+def _build_gap_records(niche: str) -> tuple:
+    """Per-keyword gap records for a niche (timestamp added by caller)"""
+    return tuple(
+        {
+            "source": "affiliate",
+            "niche": niche,
+            "keyword": keyword,
+            "estimated_commission": "$20-100/sale",
+            "competition": "medium",
+            "content_type": "review"
+        }
+        for keyword in HIGH_DEMAND_KEYWORDS.get(niche, ())
+    )
+
+
 class AffiliateHunter:
     """
     Hunts high-converting affiliate opportunities.
@@ -524,39 +809,22 @@ class AffiliateHunter:
     
     # High-converting niches with affiliate programs
     AFFILIATE_NICHES = {
-        "software": ["clickbank", "jvzoo", "warriorplus"],
-        "finance": ["clickbank", "cj", "shareasale"],
-        "health": ["clickbank", "digistore24"],
-        "education": ["clickbank", "teachable", "skillshare"],
-        "ecommerce": ["amazon", "shopify", "etsy"]
+        "software": ("clickbank", "jvzoo", "warriorplus"),
+        "finance": ("clickbank", "cj", "shareasale"),
+        "health": ("clickbank", "digistore24"),
+        "education": ("clickbank", "teachable", "skillshare"),
+        "ecommerce": ("amazon", "shopify", "etsy")
     }
     
     async def find_gaps(self, niche: str) -> list:
         """Find content gaps in affiliate niches"""
-        opportunities = []
-        
         # This would integrate with affiliate network APIs
         # For now, returns structured opportunity data
-        
-        high_demand_keywords = {
-            "software": ["ai tools", "automation software", "productivity apps"],
-            "finance": ["budgeting apps", "investing for beginners", "side hustle ideas"],
-            "health": ["weight loss supplements", "fitness equipment", "wellness products"],
-            "education": ["online courses", "skill development", "certification programs"]
-        }
-        
-        for keyword in high_demand_keywords.get(niche, []):
-            opportunities.append({
-                "source": "affiliate",
-                "niche": niche,
-                "keyword": keyword,
-                "estimated_commission": "$20-100/sale",
-                "competition": "medium",
-                "content_type": "review",
-                "timestamp": datetime.utcnow().isoformat()
-            })
-            
-        return opportunities
+        now_iso = datetime.now(timezone.utc).isoformat()
+        return [
+            {**record, "timestamp": now_iso}
+            for record in _build_gap_records(niche)
+        ]
 
 
 # ============================================================
@@ -567,6 +835,9 @@ class MasterHunter:
     """
     Master Hunter that orchestrates all hunting engines.
     Called by n8n to get the best opportunities.
+    
+    Each hunt()/quick_hunt() call owns the sub-hunters' pooled clients:
+    connections are shared by that call's requests and closed when it returns.
     """
     
     def __init__(self):
@@ -585,7 +856,7 @@ class MasterHunter:
             niches = HunterConfig.NICHES
             
         results = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
             "reddit": [],
             "google_trends": [],
             "youtube": [],
@@ -594,56 +865,77 @@ class MasterHunter:
             "top_opportunities": []
         }
         
-        # Hunt Reddit
-        subreddits = [
-            "entrepreneur", "passive_income", "sidehustle",
-            "financialindependence", "beermoney", "WorkOnline"
-        ]
-        results["reddit"] = await self.reddit.hunt_multiple(subreddits)
-        
-        # Hunt Google Trends
-        results["google_trends"] = await self.google.get_trending_searches()
-        
-        # Hunt News (NewsAPI)
-        news_categories = ["business", "technology"]
-        for category in news_categories:
-            news_results = await self.news.get_top_headlines(category)
-            results["news"].extend(news_results)
-        
-        # Hunt YouTube (if API key configured)
-        for niche in niches[:3]:  # Limit to conserve API quota
-            yt_results = await self.youtube.search_niche(niche)
-            results["youtube"].extend(yt_results)
-        
-        # Hunt Affiliate Opportunities
-        for niche in ["software", "finance", "health"]:
-            aff_results = await self.affiliate.find_gaps(niche)
-            results["affiliate"].extend(aff_results)
-        
-        # Compile top opportunities
-        all_opps = []
-        for source in ["reddit", "youtube", "news"]:
-            for opp in results[source][:5]:
-                all_opps.append(opp)
-        
-        results["top_opportunities"] = sorted(
-            all_opps,
-            key=lambda x: x.get("opportunity_score", 0),
-            reverse=True
-        )[:10]
-        
-        return results
+        try:
+            subreddits = HunterConfig.SUBREDDITS
+            news_categories = HunterConfig.NEWS_CATEGORIES
+            
+            # All sources hit independent hosts - overlap their network latency
+            reddit_r, trends_r, yt_r, news_r, aff_r = await asyncio.gather(
+                self.reddit.hunt_multiple(subreddits),
+                self.google.get_trending_searches(),
+                # Limit to conserve API quota; one shared stats call for all niches
+                self.youtube.search_niches(niches[:3]),
+                asyncio.gather(
+                    *[self.news.get_top_headlines(c) for c in news_categories],
+                    return_exceptions=True
+                ),
+                asyncio.gather(
+                    *[self.affiliate.find_gaps(n) for n in HunterConfig.AFFILIATE_HUNT_NICHES],
+                    return_exceptions=True
+                ),
+                return_exceptions=True
+            )
+            
+            for key, result in (("reddit", reddit_r), ("google_trends", trends_r), ("youtube", yt_r)):
+                if isinstance(result, Exception):
+                    print(f"[HUNTER] {key} hunt failed: {result}")
+                else:
+                    results[key] = result
+            
+            for key, batches in (("news", news_r), ("affiliate", aff_r)):
+                if isinstance(batches, Exception):
+                    print(f"[HUNTER] {key} hunt failed: {batches}")
+                    continue
+                ok = [b for b in batches if not isinstance(b, Exception)]
+                for err in (b for b in batches if isinstance(b, Exception)):
+                    print(f"[HUNTER] {key} hunt failed: {err}")
+                results[key] = list(itertools.chain.from_iterable(ok))
+            
+            # Compile top opportunities
+            all_opps = []
+            for source in ["reddit", "youtube", "news"]:
+                for opp in results[source][:5]:
+                    all_opps.append(opp)
+            
+            results["top_opportunities"] = heapq.nlargest(
+                10,
+                all_opps,
+                key=lambda x: x.get("opportunity_score", 0)
+            )
+            
+            return results
+        finally:
+            # Release pooled connections even when a stage raises
+            await self.aclose()
+    
+    async def aclose(self):
+        """Release pooled HTTP connections held by the sub-hunters"""
+        await self.google.aclose()
+        await self.youtube.aclose()
     
     async def quick_hunt(self, source: str, query: str = None) -> list:
         """Quick hunt on a single source"""
-        if source == "reddit" and query:
-            return await self.reddit.hunt_subreddit(query)
-        elif source == "youtube" and query:
-            return await self.youtube.search_niche(query)
-        elif source == "trends":
-            return await self.google.get_trending_searches()
-        else:
-            return []
+        try:
+            if source == "reddit" and query:
+                return await self.reddit.hunt_subreddit(query)
+            elif source == "youtube" and query:
+                return await self.youtube.search_niche(query)
+            elif source == "trends":
+                return await self.google.get_trending_searches()
+            else:
+                return []
+        finally:
+            await self.aclose()
 
 
 # ============================================================
@@ -672,6 +964,13 @@ if __name__ == "__main__":
         else:
             results = await hunter.hunt()
         
-        print(json.dumps(results, indent=2))
+        print(_json_dumps(results, pretty=True).decode())
+    
+    # libuv event loop when available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
     
     asyncio.run(main())
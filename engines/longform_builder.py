@@ -15,18 +15,26 @@ The Revenue Leap:
 5. Resolution (14-20 min) - Strategic understanding
 """
 
-import subprocess
 import os
+import importlib.util
 import json
 import asyncio
 import tempfile
 import re
+import uuid
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 
+from engines.hw_encoder import (
+    detect_hw_encoder,
+    hw_device_args as _hw_device_args,
+    pixel_format_filter as _pixel_format_filter,
+)
+
 # Production constants
 LF_BITRATE = "18M"  # 4K-ready bitrate
 LF_MINRATE = "12M"
@@ -34,6 +42,8 @@ LF_MAXRATE = "24M"
 LF_BUFSIZE = "36M"
 LF_PRESET = "slow"
 TARGET_DURATION = 900  # 15 minutes default
+# Re-enables the 5x5 unsharp pass
+LF_HIGH_QUALITY = os.getenv("LF_HIGH_QUALITY", "").strip().lower() in {"1", "true", "yes", "on"}
 
 BASE_DIR = Path(__file__).parent.parent
 OUTPUT_DIR = BASE_DIR / "data" / "output" / "longform"
@@ -48,6 +58,225 @@ ACT_STRUCTURE = {
     "resolution": {"start": 840, "end": 1200, "intensity": "conclusive", "visual_density": "medium"},
 }
 
+# Audio durations keyed by (path, mtime, size) - survives restarts
+DURATION_CACHE_PATH = BASE_DIR / "data" / "audio" / "longform" / ".duration_cache.json"
+_DURATION_CACHE: Optional[Dict[str, float]] = None
+
+
+def _duration_cache_key(audio_path: str) -> Optional[str]:
+    """Cache key that changes whenever the file is rewritten."""
+    try:
+        st = os.stat(audio_path)
+    except OSError:
+        return None
+    return f"{os.path.abspath(audio_path)}|{st.st_mtime_ns}|{st.st_size}"
+
+
+def _load_duration_cache() -> Dict[str, float]:
+    """Load the on-disk duration cache once per process."""
+    global _DURATION_CACHE
+    if _DURATION_CACHE is None:
+        try:
+            _DURATION_CACHE = json.loads(DURATION_CACHE_PATH.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            _DURATION_CACHE = {}
+    return _DURATION_CACHE
+
+
+def get_cached_duration(audio_path: str) -> Optional[float]:
+    """Return a previously probed duration if the file is unchanged."""
+    key = _duration_cache_key(audio_path)
+    if key is None:
+        return None
+    return _load_duration_cache().get(key)
+
+
+def store_cached_duration(audio_path: str, duration: float) -> None:
+    """Record a probed duration and persist the cache atomically."""
+    key = _duration_cache_key(audio_path)
+    if key is None:
+        return
+    cache = _load_duration_cache()
+    cache[key] = duration
+    try:
+        DURATION_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = DURATION_CACHE_PATH.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp_path, DURATION_CACHE_PATH)
+    except OSError as e:
+        print(f"[LONGFORM] Could not persist duration cache: {e}")
+
+
+async def get_audio_duration(audio_path: str) -> Optional[float]:
+    """Audio duration in seconds (persistent cache, probe on miss); None if unreadable."""
+    cached = get_cached_duration(audio_path)
+    if cached is not None:
+        return cached
+    
+    duration = await _probe_audio_duration(audio_path)
+    if duration is not None:
+        store_cached_duration(audio_path, duration)
+    return duration
+
+
+async def _probe_audio_duration(audio_path: str) -> Optional[float]:
+    """Audio duration via mutagen, ffprobe fallback (None if both fail)."""
+    try:
+        import mutagen
+        info = mutagen.File(audio_path)
+        if info is not None and info.info.length:
+            return float(info.info.length)
+    except Exception:
+        pass  # No mutagen, or a header it can't parse - ask ffprobe
+    
+    try:
+        process = await asyncio.create_subprocess_exec(
+            "ffprobe", "-v", "error",
+            "-probesize", "32", "-analyzeduration", "0",
+            "-read_intervals", "%+#1",
+            "-show_entries", "format=duration",
+            "-of", "json", audio_path,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL
+        )
+        stdout, _ = await process.communicate()
+        duration = float(json.loads(stdout)["format"]["duration"])
+        return duration if duration > 0 else None
+    except Exception:
+        return None
+
+
+def _unique_filename(prefix: str, ext: str) -> str:
+    """Sortable timestamped name with a random suffix - safe for parallel jobs."""
+    return f"{prefix}_{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}.{ext}"
+
+
+# ffprobe results per B-roll file, keyed by (path, mtime, size) so a clip
+# replaced in place is re-probed; least recently used entries drop first
+STREAM_PROBE_CACHE_SIZE = 512
+_STREAM_PROBE_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+
+
+# Fixed filtergraphs - built once at import; only the pixel-format tail and
+# per-clip trim vary per render. Motion and grading run at 1080p; the only
+# 4K frame buffer is the final lanczos upscale.
+_VF_UPSCALE_4K = "scale=3840:2160:flags=lanczos"
+_VF_NOBROLL = (
+    "scale=1920:1080:force_original_aspect_ratio=increase,"
+    "crop=1920:1080,"
+    "fps=30,"
+    "zoompan=z='min(zoom+0.0002,1.15)':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d=1:s=1920x1080,"
+    "eq=contrast=1.08:saturation=1.10:brightness=0.02,"
+    + _VF_UPSCALE_4K
+)
+_VF_BROLL_CLIP = (
+    "setpts=PTS-STARTPTS,"
+    "scale=1920:1080:force_original_aspect_ratio=increase,"
+    "crop=1920:1080,setsar=1,fps=30"
+)
+# Zoompan at 1080p (1/4 the pixels), then one lanczos upscale to 4K
+_VF_BROLL = (
+    "zoompan=z='min(zoom+0.0003,1.2)':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d=1:s=1920x1080,"
+    "eq=contrast=1.10:saturation=1.12:brightness=0.02,"
+    + ("unsharp=5:5:0.8," if LF_HIGH_QUALITY else "")
+    + _VF_UPSCALE_4K
+)
+
+
+# Demuxers for inputs whose container we produce/know - skips format detection
+_KNOWN_INPUT_FORMATS = {".mp4": "mp4", ".mp3": "mp3"}
+
+
+def _fast_input_args(path: str) -> List[str]:
+    """Per-input flags that shrink ffmpeg's probe for known local files."""
+    fmt = _KNOWN_INPUT_FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt is None:
+        return []
+    return ["-probesize", "32", "-analyzeduration", "0", "-f", fmt]
+
+
+def _video_encoder_args(encoder: str) -> List[str]:
+    """Encoder-specific rate control at the documentary bitrate ladder."""
+    if encoder == "h264_nvenc":
+        return [
+            "-c:v", "h264_nvenc",
+            "-profile:v", "high",
+            "-preset", "p5",
+            "-rc", "vbr",
+            "-cq", "19",
+            "-b:v", LF_BITRATE,
+            "-maxrate", LF_MAXRATE,
+            "-bufsize", LF_BUFSIZE,
+        ]
+    if encoder in ("h264_qsv", "h264_videotoolbox", "h264_vaapi"):
+        return [
+            "-c:v", encoder,
+            "-profile:v", "high",
+            "-b:v", LF_BITRATE,
+            "-maxrate", LF_MAXRATE,
+            "-bufsize", LF_BUFSIZE,
+        ]
+    return [
+        "-c:v", "libx264",
+        "-profile:v", "high",
+        "-level", "5.1",
+        "-preset", LF_PRESET,
+        "-b:v", LF_BITRATE,
+        "-minrate", LF_MINRATE,
+        "-maxrate", LF_MAXRATE,
+        "-bufsize", LF_BUFSIZE,
+    ]
+
+
+# DNA classifier keyword groups, in priority order
+THEME_KEYWORDS = (
+    (frozenset({"rich", "wealth", "money", "billion"}), "wealth_inequality"),
+    (frozenset({"system", "control", "design", "algorithm"}), "systemic_manipulation"),
+    (frozenset({"bank", "fed", "reserve", "credit"}), "financial_power"),
+    (frozenset({"ai", "future", "obsolete", "automation"}), "technological_disruption"),
+)
+EMOTION_KEYWORDS = (
+    (frozenset({"unfair", "rigged", "designed"}), "injustice"),
+    (frozenset({"secret", "hidden", "never told"}), "revelation"),
+    (frozenset({"disappear", "collapse", "end"}), "urgency"),
+)
+
+# Visual intent to B-roll category mapping
+INTENT_CATEGORIES = {
+    "power_finance": ("money", "city"),
+    "systems_control": ("tech", "city"),
+    "future_warning": ("tech", "city"),
+    "wealth": ("money", "lifestyle"),
+    "psychology": ("people",),
+}
+DEFAULT_BROLL_CATEGORIES = ("money", "tech", "city")
+
+
+def _keyword_alternation(words) -> "re.Pattern":
+    """
+    Compile a keyword group into one case-insensitive alternation.
+    Anchored at word starts so "ai" no longer fires on "again"/"main",
+    while inflections ("designed", "banking") still match.
+    """
+    return re.compile(
+        r"\b(?:" + "|".join(re.escape(w) for w in sorted(words)) + ")",
+        re.IGNORECASE
+    )
+
+
+# DNA classifiers - compiled once, first match wins
+THEME_PATTERNS = [(_keyword_alternation(words), theme) for words, theme in THEME_KEYWORDS]
+EMOTION_PATTERNS = [(_keyword_alternation(words), emotion) for words, emotion in EMOTION_KEYWORDS]
+CURIOSITY_GAP_QUESTIONS = (
+    ("how", "How does this actually work?"),
+    ("who", "Who benefits from this?"),
+    ("why", "Why was this designed this way?"),
+)
+CURIOSITY_WORD_PATTERN = re.compile(r"\b(how|who|why)", re.IGNORECASE)
+
+# Narration is segmented for TTS on sentence ends
+SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?])\s+")
+
 
 # ============================================================
 # HARDENED ASYNC AUDIO ENGINE
@@ -80,6 +309,16 @@ class LongformAudioEngine:
     
     MIN_SCRIPT_WORDS = 100
     MAX_RETRIES = 3
+    SEGMENT_MAX_CHARS = 800
+    MIN_SEGMENT_BYTES = 1000  # Anything smaller is a truncated/empty stream
+    TTS_CONCURRENCY = 6  # Concurrent edge-tts sessions (stay under throttling)
+    GTTS_CONCURRENCY = 2  # gTTS hits Google's translate endpoint - rate limited
+    
+    # edge-tts module, resolved once for every engine instance
+    _edge_tts_mod = None
+    _edge_tts_available: Optional[bool] = None
+    # (loop, semaphore) shared by every engine instance on that loop
+    _gtts_gate: Optional[Tuple[asyncio.AbstractEventLoop, asyncio.Semaphore]] = None
     VOICE_FALLBACKS = [
         TTSVoice.ANDREW,
         TTSVoice.GUY, 
@@ -90,21 +329,19 @@ class LongformAudioEngine:
     def __init__(self, output_dir: Path = None):
         self.output_dir = output_dir or (BASE_DIR / "data" / "audio" / "longform")
         self.output_dir.mkdir(parents=True, exist_ok=True)
-        self._edge_tts_available = None
     
-    async def _check_edge_tts(self) -> bool:
-        """Check if edge-tts is available."""
-        if self._edge_tts_available is not None:
-            return self._edge_tts_available
-        
-        try:
-            import edge_tts
-            self._edge_tts_available = True
-        except ImportError:
-            print("[AUDIO] Warning: edge-tts not installed. Run: pip install edge-tts")
-            self._edge_tts_available = False
+    @classmethod
+    def _ensure_edge_tts_loaded(cls):
+        """Import edge-tts once per process; returns the module or None."""
+        if cls._edge_tts_available is None:
+            try:
+                cls._edge_tts_mod = importlib.import_module("edge_tts")
+                cls._edge_tts_available = True
+            except ImportError:
+                print("[AUDIO] Warning: edge-tts not installed. Run: pip install edge-tts")
+                cls._edge_tts_available = False
         
-        return self._edge_tts_available
+        return cls._edge_tts_mod
     
     def _validate_script(self, script: str) -> Tuple[bool, str]:
         """
@@ -115,8 +352,9 @@ class LongformAudioEngine:
             return False, ""
         
         # Clean script
-        cleaned = re.sub(r'\s+', ' ', script.strip())
-        word_count = len(cleaned.split())
+        parts = script.split()
+        word_count = len(parts)
+        cleaned = " ".join(parts)
         
         if word_count < self.MIN_SCRIPT_WORDS:
             print(f"[AUDIO] Script too short: {word_count} words (min: {self.MIN_SCRIPT_WORDS})")
@@ -152,63 +390,252 @@ class LongformAudioEngine:
             return None
         
         # Check edge-tts availability
-        if not await self._check_edge_tts():
+        edge_tts = self._ensure_edge_tts_loaded()
+        if edge_tts is None:
             return await self._fallback_gtts(cleaned_script, output_filename)
         
-        import edge_tts
-        
         # Generate filename
         if output_filename is None:
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            output_filename = f"narration_{timestamp}.mp3"
+            output_filename = _unique_filename("narration", "mp3")
         
         output_path = self.output_dir / output_filename
         
-        # Attempt generation with retries and voice fallbacks
-        for attempt, fallback_voice in enumerate(self.VOICE_FALLBACKS):
-            current_voice = voice if attempt == 0 else fallback_voice
-            
+        # Synthesize sentence-packed segments concurrently (one websocket each)
+        segments = self._segment_script(cleaned_script)
+        print(f"[AUDIO] Generating narration with {voice.name} ({len(segments)} segments)...")
+        
+        semaphore = asyncio.Semaphore(self.TTS_CONCURRENCY)
+        segment_paths = await asyncio.gather(*[
+            self._synth_segment(
+                edge_tts, segment, voice, rate, pitch,
+                self.output_dir / f"{output_path.stem}_{i:03d}.mp3",
+                semaphore
+            )
+            for i, segment in enumerate(segments)
+        ])
+        
+        return await self._finalize_segments(list(segment_paths), output_path)
+    
+    async def generate_narration_stream(
+        self,
+        sentences: AsyncIterator[str],
+        voice: TTSVoice = TTSVoice.ANDREW,
+        output_filename: str = None,
+        rate: str = "+0%",
+        pitch: str = "+0Hz"
+    ) -> Optional[str]:
+        """
+        Generate narration while the script is still being written.
+        
+        Sentences are packed into segments as they arrive and each segment
+        is synthesized immediately, so TTS overlaps with LLM generation.
+        """
+        edge_tts = self._ensure_edge_tts_loaded()
+        if edge_tts is None:
+            script = " ".join([sentence async for sentence in sentences])
+            return await self.generate_narration(script, voice, output_filename, rate, pitch)
+        
+        if output_filename is None:
+            output_filename = _unique_filename("narration", "mp3")
+        
+        output_path = self.output_dir / output_filename
+        queue: asyncio.Queue = asyncio.Queue()
+        word_count = 0
+        
+        async def produce():
+            nonlocal word_count
+            current = ""
             try:
-                print(f"[AUDIO] Generating narration with {current_voice.name}...")
-                
-                communicate = edge_tts.Communicate(
-                    cleaned_script,
-                    current_voice.value,
-                    rate=rate,
-                    pitch=pitch
-                )
-                
-                await communicate.save(str(output_path))
+                async for sentence in sentences:
+                    parts = sentence.split()
+                    if not parts:
+                        continue
+                    word_count += len(parts)
+                    sentence = " ".join(parts)
+                    if current and len(current) + 1 + len(sentence) > self.SEGMENT_MAX_CHARS:
+                        await queue.put(current)
+                        current = sentence
+                    else:
+                        current = f"{current} {sentence}" if current else sentence
+                if current:
+                    await queue.put(current)
+            finally:
+                await queue.put(None)
+        
+        print(f"[AUDIO] Streaming narration with {voice.name}...")
+        producer = asyncio.create_task(produce())
+        semaphore = asyncio.Semaphore(self.TTS_CONCURRENCY)
+        tasks = []
+        
+        while (segment := await queue.get()) is not None:
+            tasks.append(asyncio.create_task(self._synth_segment(
+                edge_tts, segment, voice, rate, pitch,
+                self.output_dir / f"{output_path.stem}_{len(tasks):03d}.mp3",
+                semaphore
+            )))
+        
+        segment_paths = list(await asyncio.gather(*tasks))
+        
+        try:
+            await producer
+            stream_ok = word_count >= self.MIN_SCRIPT_WORDS
+            if not stream_ok:
+                print(f"[AUDIO] Script too short: {word_count} words (min: {self.MIN_SCRIPT_WORDS})")
+        except Exception as e:
+            print(f"[AUDIO] Script stream failed: {e}")
+            stream_ok = False
+        
+        if not stream_ok:
+            for path in segment_paths:
+                if path is not None and os.path.exists(path):
+                    os.remove(path)
+            print("[AUDIO] ❌ Script validation failed")
+            return None
+        
+        return await self._finalize_segments(segment_paths, output_path)
+    
+    async def _finalize_segments(
+        self,
+        segment_paths: List[Optional[str]],
+        output_path: Path
+    ) -> Optional[str]:
+        """Join synthesized segments into output_path and remove the parts."""
+        try:
+            if not segment_paths or any(path is None for path in segment_paths):
+                print("[AUDIO] ❌ All TTS attempts failed")
+                return None
+            
+            if len(segment_paths) == 1:
+                os.replace(segment_paths[0], output_path)
+            elif not await self._concat_mp3(segment_paths, output_path):
+                print("[AUDIO] ❌ Segment concat failed")
+                return None
+        finally:
+            for path in segment_paths:
+                if path is not None and os.path.exists(path):
+                    os.remove(path)
+        
+        # Verify file was created and has content
+        if output_path.exists() and output_path.stat().st_size > 1000:
+            duration = await get_audio_duration(str(output_path)) or 0.0
+            print(f"[AUDIO] ✅ Narration generated: {duration/60:.1f} minutes")
+            return str(output_path)
+        
+        print("[AUDIO] ❌ Narration output missing or empty")
+        return None
+    
+    def _segment_script(self, cleaned: str, max_chars: int = None) -> List[str]:
+        """Greedily pack whole sentences into segments of at most max_chars."""
+        max_chars = max_chars or self.SEGMENT_MAX_CHARS
+        segments: List[str] = []
+        current = ""
+        
+        for sentence in SENTENCE_BOUNDARY.split(cleaned):
+            if current and len(current) + 1 + len(sentence) > max_chars:
+                segments.append(current)
+                current = sentence
+            else:
+                current = f"{current} {sentence}" if current else sentence
+        
+        if current:
+            segments.append(current)
+        return segments
+    
+    async def _synth_segment(
+        self,
+        edge_tts,
+        text: str,
+        voice: TTSVoice,
+        rate: str,
+        pitch: str,
+        segment_path: Path,
+        semaphore: asyncio.Semaphore
+    ) -> Optional[str]:
+        """Synthesize one segment, retrying with voice fallbacks."""
+        async with semaphore:
+            for attempt, fallback_voice in enumerate(self.VOICE_FALLBACKS):
+                current_voice = voice if attempt == 0 else fallback_voice
                 
-                # Verify file was created and has content
-                if output_path.exists() and output_path.stat().st_size > 1000:
-                    duration = await self._get_audio_duration(str(output_path))
-                    print(f"[AUDIO] ✅ Narration generated: {duration/60:.1f} minutes")
-                    return str(output_path)
+                try:
+                    communicate = edge_tts.Communicate(
+                        text,
+                        current_voice.value,
+                        rate=rate,
+                        pitch=pitch
+                    )
                     
-            except Exception as e:
-                print(f"[AUDIO] Attempt {attempt + 1} failed with {current_voice.name}: {e}")
-                if attempt < self.MAX_RETRIES - 1:
-                    await asyncio.sleep(1)  # Brief pause before retry
-                continue
+                    # Stream to disk and count bytes as they arrive - no
+                    # post-save stat, and a dead stream fails this attempt
+                    total = 0
+                    with open(segment_path, "wb") as f:
+                        async for chunk in communicate.stream():
+                            if chunk["type"] == "audio":
+                                f.write(chunk["data"])
+                                total += len(chunk["data"])
+                    
+                    if total < self.MIN_SEGMENT_BYTES:
+                        raise RuntimeError(f"only {total} bytes of audio")
+                    return str(segment_path)
+                        
+                except Exception as e:
+                    print(f"[AUDIO] {segment_path.name} attempt {attempt + 1} failed with {current_voice.name}: {e}")
+                    if attempt < self.MAX_RETRIES - 1:
+                        await asyncio.sleep(1)  # Brief pause before retry
+                    continue
         
-        print("[AUDIO] ❌ All TTS attempts failed")
+        segment_path.unlink(missing_ok=True)
         return None
     
+    async def _concat_mp3(self, segment_paths: List[str], output_path: Path) -> bool:
+        """Join MP3 segments losslessly with the ffmpeg concat demuxer."""
+        list_path = output_path.with_suffix(".txt")
+        # ffmpeg resolves list entries against the list's own directory -
+        # write absolute paths so relative output/audio dirs still work
+        list_path.write_text(
+            "".join(
+                "file '{}'\n".format(Path(p).resolve().as_posix().replace("'", "'\\''"))
+                for p in segment_paths
+            ),
+            encoding="utf-8"
+        )
+        
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffmpeg", "-y",
+                "-f", "concat", "-safe", "0",
+                "-i", str(list_path),
+                "-c", "copy",
+                str(output_path),
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE
+            )
+            await process.communicate()
+            return process.returncode == 0
+        finally:
+            list_path.unlink(missing_ok=True)
+    
+    @classmethod
+    def _gtts_semaphore(cls) -> asyncio.Semaphore:
+        """Class-wide gTTS limiter, rebuilt if the event loop changes."""
+        loop = asyncio.get_running_loop()
+        if cls._gtts_gate is None or cls._gtts_gate[0] is not loop:
+            cls._gtts_gate = (loop, asyncio.Semaphore(cls.GTTS_CONCURRENCY))
+        return cls._gtts_gate[1]
+    
     async def _fallback_gtts(self, script: str, output_filename: str = None) -> Optional[str]:
         """Fallback to gTTS if edge-tts is unavailable."""
         try:
             from gtts import gTTS
             
             if output_filename is None:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                output_filename = f"narration_{timestamp}.mp3"
+                output_filename = _unique_filename("narration", "mp3")
             
             output_path = self.output_dir / output_filename
             
             print("[AUDIO] Using gTTS fallback...")
-            tts = gTTS(text=script, lang='en', slow=False)
-            tts.save(str(output_path))
+            async with self._gtts_semaphore():
+                tts = gTTS(text=script, lang='en', slow=False)
+                await asyncio.to_thread(tts.save, str(output_path))
             
             if output_path.exists():
                 print("[AUDIO] ✅ Fallback narration generated")
@@ -221,18 +648,6 @@ class LongformAudioEngine:
         
         return None
     
-    async def _get_audio_duration(self, audio_path: str) -> float:
-        """Get audio file duration using ffprobe."""
-        try:
-            result = subprocess.run([
-                "ffprobe", "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "json", audio_path
-            ], capture_output=True, text=True)
-            return float(json.loads(result.stdout)["format"]["duration"])
-        except:
-            return 0.0
-    
     async def add_pacing_pauses(
         self, 
         audio_path: str, 
@@ -261,9 +676,113 @@ class LongformAudioEngine:
         
         output_path = audio_path.replace('.mp3', '_paced.mp3')
         
-        # For now, just return original (FFmpeg concatenation of silence would go here)
-        # This is a placeholder for full implementation
-        return audio_path
+        duration = await get_audio_duration(audio_path) or 0.0
+        pauses = sorted((t, d) for t, d in section_pauses if 0 < t < duration and d > 0)
+        if not pauses:
+            return audio_path
+        
+        audio_format = await self._probe_audio_format(audio_path)
+        if audio_format is None:
+            print("[AUDIO] Could not read narration format - skipping pacing")
+            return audio_path
+        
+        # Cut narration at the pause points (stream copy, frame aligned) while
+        # the matching silences render; then splice everything without re-encoding
+        cuts = [0.0] + [t for t, _ in pauses] + [duration]
+        stem = Path(output_path).with_suffix("")
+        part_paths = [f"{stem}_part{i:02d}.mp3" for i in range(len(cuts) - 1)]
+        silence_durations = sorted({d for _, d in pauses})
+        
+        try:
+            results = await asyncio.gather(
+                *[
+                    self._run_ffmpeg(
+                        "-ss", f"{start:.3f}", "-to", f"{end:.3f}",
+                        "-i", audio_path, "-c", "copy", part_path
+                    )
+                    for start, end, part_path in zip(cuts, cuts[1:], part_paths)
+                ],
+                *[self._render_silence(d, *audio_format) for d in silence_durations]
+            )
+            cut_ok = all(results[:len(part_paths)])
+            silences = dict(zip(silence_durations, results[len(part_paths):]))
+            
+            if not cut_ok or not all(silences.values()):
+                print("[AUDIO] Pacing split failed - keeping original narration")
+                return audio_path
+            
+            sequence = [part_paths[0]]
+            for (_, pause), part_path in zip(pauses, part_paths[1:]):
+                sequence += [silences[pause], part_path]
+            
+            if not await self._concat_mp3(sequence, Path(output_path)):
+                print("[AUDIO] Pacing concat failed - keeping original narration")
+                return audio_path
+        finally:
+            for part_path in part_paths:
+                if os.path.exists(part_path):
+                    os.remove(part_path)
+        
+        total_pause = sum(d for _, d in pauses)
+        print(f"[AUDIO] Added {len(pauses)} pacing pauses ({total_pause:.1f}s)")
+        return output_path
+    
+    async def _probe_audio_format(self, audio_path: str) -> Optional[Tuple[int, int, int]]:
+        """(sample_rate, channels, bit_rate) of the first audio stream."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffprobe", "-v", "error",
+                "-select_streams", "a:0",
+                "-show_entries", "stream=sample_rate,channels,bit_rate",
+                "-of", "json", audio_path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _ = await process.communicate()
+            stream = json.loads(stdout)["streams"][0]
+            return int(stream["sample_rate"]), int(stream["channels"]), int(stream["bit_rate"])
+        except Exception:
+            return None
+    
+    async def _render_silence(
+        self,
+        seconds: float,
+        sample_rate: int,
+        channels: int,
+        bit_rate: int
+    ) -> Optional[str]:
+        """
+        Pre-rendered silent MP3 matching the narration's encoding, so it can be
+        stream-copied between narration parts. Rendered once per format.
+        """
+        silence_path = self.output_dir / f"_silence_{seconds:.1f}s_{sample_rate}_{channels}ch_{bit_rate // 1000}k.mp3"
+        if silence_path.exists():
+            return str(silence_path)
+        
+        layout = "mono" if channels == 1 else "stereo"
+        tmp_path = silence_path.with_name(f"{silence_path.stem}.tmp.mp3")
+        ok = await self._run_ffmpeg(
+            "-f", "lavfi", "-i", f"anullsrc=r={sample_rate}:cl={layout}",
+            "-t", f"{seconds:.3f}",
+            "-c:a", "libmp3lame", "-b:a", str(bit_rate),
+            str(tmp_path)
+        )
+        if not ok:
+            tmp_path.unlink(missing_ok=True)
+            return None
+        
+        os.replace(tmp_path, silence_path)
+        return str(silence_path)
+    
+    async def _run_ffmpeg(self, *args: str) -> bool:
+        """Run one quiet ffmpeg invocation without blocking the event loop."""
+        process = await asyncio.create_subprocess_exec(
+            "ffmpeg", "-y", "-v", "error", *args,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.PIPE
+        )
+        await process.communicate()
+        return process.returncode == 0
     
     async def generate_from_script_with_validation(
         self,
@@ -331,6 +850,22 @@ class ActContent:
     music_mood: str
 
 
+@dataclass
+class BrollTrack:
+    """B-roll timeline as parallel arrays (one entry per clip slot)."""
+    paths: List[str] = field(default_factory=list)
+    categories: List[str] = field(default_factory=list)
+    start_times: List[float] = field(default_factory=list)
+    
+    def __len__(self) -> int:
+        return len(self.paths)
+    
+    def append(self, path: str, category: str, start_time: float):
+        self.paths.append(path)
+        self.categories.append(category)
+        self.start_times.append(start_time)
+
+
 class LongformBuilder:
     """
     Hollywood-grade documentary assembler.
@@ -355,13 +890,16 @@ class LongformBuilder:
         Extract documentary DNA from a winning Short.
         This is where Shorts become documentaries.
         """
+        topic = short_data.get("topic", "")
+        script = short_data.get("script", "")
+        
         return DocumentaryDNA(
-            topic=short_data.get("topic", ""),
-            theme=self._detect_theme(short_data.get("topic", "")),
+            topic=topic,
+            theme=self._detect_theme(topic),
             hook_structure=short_data.get("hook_type", "curiosity_threat"),
-            emotional_trigger=self._detect_emotion(short_data.get("script", "")),
+            emotional_trigger=self._detect_emotion(script),
             visual_intent=short_data.get("visual_intent", "power_finance"),
-            curiosity_gaps=self._extract_curiosity_gaps(short_data.get("script", "")),
+            curiosity_gaps=self._extract_curiosity_gaps(script),
             retention_pattern=short_data.get("retention_pattern", "front_loaded"),
             rpm_score=short_data.get("rpm", 0.0),
             source_short_id=short_data.get("video_id")
@@ -369,37 +907,22 @@ class LongformBuilder:
     
     def _detect_theme(self, topic: str) -> str:
         """Detect documentary theme from topic."""
-        topic_lower = topic.lower()
-        if any(w in topic_lower for w in ["rich", "wealth", "money", "billion"]):
-            return "wealth_inequality"
-        if any(w in topic_lower for w in ["system", "control", "design", "algorithm"]):
-            return "systemic_manipulation"
-        if any(w in topic_lower for w in ["bank", "fed", "reserve", "credit"]):
-            return "financial_power"
-        if any(w in topic_lower for w in ["ai", "future", "obsolete", "automation"]):
-            return "technological_disruption"
+        for pattern, theme in THEME_PATTERNS:
+            if pattern.search(topic):
+                return theme
         return "hidden_truth"
     
     def _detect_emotion(self, script: str) -> str:
         """Detect primary emotional trigger."""
-        script_lower = script.lower()
-        if any(w in script_lower for w in ["unfair", "rigged", "designed"]):
-            return "injustice"
-        if any(w in script_lower for w in ["secret", "hidden", "never told"]):
-            return "revelation"
-        if any(w in script_lower for w in ["disappear", "collapse", "end"]):
-            return "urgency"
+        for pattern, emotion in EMOTION_PATTERNS:
+            if pattern.search(script):
+                return emotion
         return "curiosity"
     
     def _extract_curiosity_gaps(self, script: str) -> List[str]:
         """Extract unanswered questions for expansion."""
-        gaps = []
-        if "how" not in script.lower():
-            gaps.append("How does this actually work?")
-        if "who" not in script.lower():
-            gaps.append("Who benefits from this?")
-        if "why" not in script.lower():
-            gaps.append("Why was this designed this way?")
+        present = {w.lower() for w in CURIOSITY_WORD_PATTERN.findall(script)}
+        gaps = [question for word, question in CURIOSITY_GAP_QUESTIONS if word not in present]
         gaps.append("What can you do about it?")
         gaps.append("What happens next?")
         return gaps
@@ -414,15 +937,16 @@ class LongformBuilder:
         Expand Short DNA into full documentary.
         This is the main production method.
         """
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        output_path = output_path or str(OUTPUT_DIR / f"doc_{timestamp}.mp4")
+        output_path = output_path or str(OUTPUT_DIR / _unique_filename("doc", "mp4"))
         
         print(f"[LONGFORM] 🎬 Building documentary: {dna.topic}")
         print(f"[LONGFORM] Theme: {dna.theme}")
         print(f"[LONGFORM] Emotional trigger: {dna.emotional_trigger}")
         
-        # Get audio duration
-        duration = await self._get_audio_duration(audio_path)
+        # Audio duration only drives B-roll scheduling; ffmpeg ends on -shortest
+        duration = await get_audio_duration(audio_path)
+        if duration is None:
+            duration = TARGET_DURATION
         print(f"[LONGFORM] Duration: {duration/60:.1f} minutes")
         
         # Select B-roll for each act
@@ -444,36 +968,15 @@ class LongformBuilder:
         
         raise RuntimeError("Documentary assembly failed")
     
-    async def _get_audio_duration(self, audio_path: str) -> float:
-        """Get audio file duration."""
-        try:
-            result = subprocess.run([
-                "ffprobe", "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "json", audio_path
-            ], capture_output=True, text=True)
-            return float(json.loads(result.stdout)["format"]["duration"])
-        except:
-            return TARGET_DURATION
-    
     async def _select_broll_for_acts(
         self,
         dna: DocumentaryDNA,
         duration: float
-    ) -> List[Dict[str, Any]]:
+    ) -> BrollTrack:
         """Select appropriate B-roll for each act."""
-        clips = []
+        track = BrollTrack()
         
-        # Visual intent to B-roll category mapping
-        intent_categories = {
-            "power_finance": ["money", "city"],
-            "systems_control": ["tech", "city"],
-            "future_warning": ["tech", "city"],
-            "wealth": ["money", "lifestyle"],
-            "psychology": ["people"],
-        }
-        
-        categories = intent_categories.get(dna.visual_intent, ["money", "tech", "city"])
+        categories = INTENT_CATEGORIES.get(dna.visual_intent, DEFAULT_BROLL_CATEGORIES)
         
         # Get clips for each act
         num_clips_needed = max(15, int(duration / 30))  # ~1 clip per 30 seconds
@@ -484,19 +987,15 @@ class LongformBuilder:
                 category = categories[i % len(categories)]
                 clip = await self.broll_engine.get_clip(category, exclude=used)
                 if clip:
-                    clips.append({
-                        "path": clip,
-                        "category": category,
-                        "start_time": i * (duration / num_clips_needed)
-                    })
+                    track.append(clip, category, i * (duration / num_clips_needed))
                     used.add(clip)
         
-        return clips
+        return track
     
     async def _assemble_documentary(
         self,
         audio_path: str,
-        broll_clips: List[Dict],
+        broll_clips: BrollTrack,
         output_path: str,
         duration: float,
         dna: DocumentaryDNA
@@ -505,79 +1004,69 @@ class LongformBuilder:
         Assemble the final documentary with cinematic treatment.
         Uses Hollywood-grade FFmpeg pipeline.
         """
-        # If no B-roll, use a single background with Ken Burns effect
-        if not broll_clips:
-            # Get any available background
-            from engines.quality_gates import VisualFallback
-            bg_path = await VisualFallback.get_fallback_background(duration=duration)
-            
-            cmd = [
+        # Fast path: one clip already at delivery spec that covers the whole
+        # narration needs no loop, no motion and no re-encode
+        if len(broll_clips) == 1 and await self._can_stream_copy(broll_clips.paths[0], duration):
+            print("[LONGFORM] B-roll matches target spec - stream copying video")
+            return await self._run_ffmpeg([
                 "ffmpeg", "-y",
-                "-stream_loop", "-1",
-                "-i", bg_path,
+                *_fast_input_args(broll_clips.paths[0]),
+                "-i", broll_clips.paths[0],
+                *_fast_input_args(audio_path),
                 "-i", audio_path,
                 "-map", "0:v:0",
                 "-map", "1:a:0",
-                "-t", str(duration),
-                "-vf", (
-                    "scale=3840:2160:force_original_aspect_ratio=increase,"
-                    "crop=3840:2160,"
-                    "fps=30,"
-                    "zoompan=z='min(zoom+0.0002,1.15)':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d=1:s=3840x2160,"
-                    "eq=contrast=1.08:saturation=1.10:brightness=0.02,"
-                    "format=yuv420p"
-                ),
-                "-c:v", "libx264",
-                "-profile:v", "high",
-                "-level", "5.1",
-                "-preset", LF_PRESET,
-                "-b:v", LF_BITRATE,
-                "-minrate", LF_MINRATE,
-                "-maxrate", LF_MAXRATE,
-                "-bufsize", LF_BUFSIZE,
+                "-c:v", "copy",
                 "-c:a", "aac",
                 "-b:a", "256k",
                 "-ar", "48000",
+                "-shortest",
                 "-movflags", "+faststart",
                 output_path
-            ]
-        else:
-            # Concatenate B-roll clips with transitions
-            # For now, use the first clip as main background
-            bg_path = broll_clips[0]["path"]
+            ])
+        
+        # First call runs test encodes per candidate - keep it off the loop
+        encoder = await asyncio.to_thread(detect_hw_encoder)
+        
+        # If no B-roll, use a single background with Ken Burns effect
+        if not broll_clips:
+            # Get any available background
+            from engines.quality_gates import VisualFallback
+            bg_path = await VisualFallback.get_fallback_background(duration=duration)
             
-            cmd = [
-                "ffmpeg", "-y",
-                "-stream_loop", "-1",
-                "-i", bg_path,
-                "-i", audio_path,
+            inputs = ["-stream_loop", "-1", *_fast_input_args(bg_path), "-i", bg_path]
+            graph_args = [
                 "-map", "0:v:0",
-                "-map", "1:a:0",
-                "-t", str(duration),
-                "-vf", (
-                    "scale=3840:2160:force_original_aspect_ratio=increase,"
-                    "crop=3840:2160,"
-                    "fps=30,"
-                    "zoompan=z='min(zoom+0.0003,1.2)':x='iw/2-(iw/zoom/2)':y='ih/2-(ih/zoom/2)':d=1:s=3840x2160,"
-                    "eq=contrast=1.10:saturation=1.12:brightness=0.02,"
-                    "unsharp=5:5:0.8,"
-                    "format=yuv420p"
-                ),
-                "-c:v", "libx264",
-                "-profile:v", "high",
-                "-level", "5.1",
-                "-preset", LF_PRESET,
-                "-b:v", LF_BITRATE,
-                "-minrate", LF_MINRATE,
-                "-maxrate", LF_MAXRATE,
-                "-bufsize", LF_BUFSIZE,
-                "-c:a", "aac",
-                "-b:a", "256k",
-                "-ar", "48000",
-                "-movflags", "+faststart",
-                output_path
+                "-vf", _VF_NOBROLL + _pixel_format_filter(encoder),
             ]
+            audio_index = 1
+        else:
+            # Every selected clip gets an equal slot; short clips loop to fill it
+            inputs, filter_complex = self._build_broll_filtergraph(broll_clips, duration, encoder)
+            graph_args = ["-filter_complex", filter_complex, "-map", "[v]"]
+            audio_index = len(broll_clips)
+        
+        cmd = [
+            "ffmpeg", "-y",
+            *_hw_device_args(encoder),
+            *inputs,
+            *_fast_input_args(audio_path),
+            "-i", audio_path,
+            *graph_args,
+            "-map", f"{audio_index}:a:0",
+            "-shortest",
+            *_video_encoder_args(encoder),
+            "-c:a", "aac",
+            "-b:a", "256k",
+            "-ar", "48000",
+            "-movflags", "+faststart",
+            output_path
+        ]
         
+        return await self._run_ffmpeg(cmd)
+    
+    async def _run_ffmpeg(self, cmd: List[str]) -> bool:
+        """Run an ffmpeg command without blocking the event loop."""
         process = await asyncio.create_subprocess_exec(
             *cmd,
             stdout=asyncio.subprocess.PIPE,
@@ -586,25 +1075,133 @@ class LongformBuilder:
         stdout, stderr = await process.communicate()
         
         return process.returncode == 0
+    
+    async def _probe_stream(self, path: str) -> Dict[str, Any]:
+        """First video stream + container duration of a clip (memoized per file version)."""
+        try:
+            st = os.stat(path)
+            key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+        except OSError:
+            key = None
+        if key in _STREAM_PROBE_CACHE:
+            _STREAM_PROBE_CACHE.move_to_end(key)
+            return _STREAM_PROBE_CACHE[key]
+        
+        info: Dict[str, Any] = {}
+        try:
+            process = await asyncio.create_subprocess_exec(
+                "ffprobe", "-v", "error",
+                "-select_streams", "v:0",
+                "-show_streams", "-show_format",
+                "-of", "json", path,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL
+            )
+            stdout, _ = await process.communicate()
+            data = json.loads(stdout)
+            if data.get("streams"):
+                info = dict(data["streams"][0])
+                info["duration"] = float(data.get("format", {}).get("duration", 0) or 0)
+        except Exception:
+            pass
+        
+        if key is not None:
+            _STREAM_PROBE_CACHE[key] = info
+            while len(_STREAM_PROBE_CACHE) > STREAM_PROBE_CACHE_SIZE:
+                _STREAM_PROBE_CACHE.popitem(last=False)
+        return info
+    
+    async def _can_stream_copy(self, path: str, duration: float) -> bool:
+        """True if the clip is already 4K/H.264/30fps and long enough to skip looping."""
+        stream = await self._probe_stream(path)
+        if not stream:
+            return False
+        
+        try:
+            num, den = stream.get("avg_frame_rate", "0/1").split("/")
+            fps = float(num) / float(den) if float(den) else 0.0
+        except ValueError:
+            return False
+        
+        return (
+            stream.get("codec_name") == "h264"
+            and stream.get("width") == 3840
+            and stream.get("height") == 2160
+            and abs(fps - 30) < 0.01
+            and stream.get("duration", 0) >= duration
+        )
+    
+    def _build_broll_filtergraph(
+        self,
+        broll_clips: BrollTrack,
+        duration: float,
+        encoder: str
+    ) -> Tuple[List[str], str]:
+        """
+        Build ffmpeg inputs + one fused filtergraph that concats every B-roll clip.
+        Each clip is trimmed to its slot, then the cinematic treatment runs once
+        on the concatenated stream at 1080p before the final 4K upscale.
+        """
+        # +1s pad so video never ends before the narration (-shortest trims it)
+        slot = (duration + 1) / len(broll_clips)
+        
+        inputs = []
+        chains = []
+        for i, path in enumerate(broll_clips.paths):
+            inputs += ["-stream_loop", "-1", *_fast_input_args(path), "-i", path]
+            chains.append(f"[{i}:v]trim=duration={slot:.3f},{_VF_BROLL_CLIP}[v{i}]")
+        
+        labels = "".join(f"[v{i}]" for i in range(len(broll_clips)))
+        chains.append(f"{labels}concat=n={len(broll_clips)}:v=1:a=0[vc]")
+        chains.append(f"[vc]{_VF_BROLL}{_pixel_format_filter(encoder)}[v]")
+        
+        return inputs, ";".join(chains)
 
 
 class DocumentaryScriptExpander:
     """
     Expands Short scripts into full documentary narration.
     150 words → 2,500+ words using the 5-Act framework.
+    
+    Owns a pooled HTTP client - use as `async with DocumentaryScriptExpander()
+    as expander:` (or await aclose()) so its connections are released.
     """
     
     def __init__(self):
         self.openai_client = None
+        self._http_client = None
         self._init_openai()
     
     def _init_openai(self):
-        """Initialize OpenAI client."""
+        """Initialize OpenAI client on a pooled transport owned by this expander."""
         try:
+            import httpx
             import openai
-            self.openai_client = openai.OpenAI()
-        except:
-            pass
+        except ImportError:
+            return
+        
+        self._http_client = httpx.AsyncClient(
+            http2=importlib.util.find_spec("h2") is not None,
+            limits=httpx.Limits(max_keepalive_connections=16, keepalive_expiry=60),
+            timeout=httpx.Timeout(60.0, connect=5.0)
+        )
+        try:
+            self.openai_client = openai.AsyncOpenAI(http_client=self._http_client)
+        except openai.OpenAIError as e:  # e.g. OPENAI_API_KEY not set
+            print(f"[LONGFORM] OpenAI unavailable, using fallback expansion: {e}")
+    
+    async def aclose(self):
+        """Close the expander's HTTP transport (call when done)"""
+        if self._http_client is not None:
+            await self._http_client.aclose()
+            self._http_client = None
+        self.openai_client = None
+    
+    async def __aenter__(self) -> "DocumentaryScriptExpander":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
     
     async def expand_script(
         self,
@@ -618,6 +1215,75 @@ class DocumentaryScriptExpander:
         if not self.openai_client:
             return self._fallback_expansion(short_script, dna)
         
+        prompt = self._build_prompt(short_script, dna, target_duration_minutes)
+        
+        try:
+            parts = [chunk async for chunk in self._stream_completion(prompt)]
+            return "".join(parts)
+        except Exception as e:
+            print(f"[LONGFORM] Script expansion error: {e}")
+            return self._fallback_expansion(short_script, dna)
+    
+    async def expand_script_stream(
+        self,
+        short_script: str,
+        dna: DocumentaryDNA,
+        target_duration_minutes: int = 15
+    ) -> AsyncIterator[str]:
+        """
+        Yield documentary narration as it is generated.
+        Lets downstream stages (TTS) start on the first act early.
+        """
+        if not self.openai_client:
+            yield self._fallback_expansion(short_script, dna)
+            return
+        
+        prompt = self._build_prompt(short_script, dna, target_duration_minutes)
+        async for chunk in self._stream_completion(prompt):
+            yield chunk
+    
+    async def expand_script_sentences(
+        self,
+        short_script: str,
+        dna: DocumentaryDNA,
+        target_duration_minutes: int = 15
+    ) -> AsyncIterator[str]:
+        """
+        Yield narration in runs of complete sentences (two or more).
+        Feeds LongformAudioEngine.generate_narration_stream.
+        """
+        buffer = ""
+        async for chunk in self.expand_script_stream(short_script, dna, target_duration_minutes):
+            buffer += chunk
+            parts = SENTENCE_BOUNDARY.split(buffer)
+            # Last part is still being written; wait for two finished sentences
+            if len(parts) > 2:
+                yield " ".join(parts[:-1])
+                buffer = parts[-1]
+        
+        if buffer.strip():
+            yield buffer.strip()
+    
+    async def _stream_completion(self, prompt: str) -> AsyncIterator[str]:
+        """Stream completion tokens without blocking the event loop."""
+        response = await self.openai_client.chat.completions.create(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": prompt}],
+            temperature=0.7,
+            max_tokens=4000,
+            stream=True
+        )
+        async for chunk in response:
+            if chunk.choices:
+                yield chunk.choices[0].delta.content or ""
+    
+    def _build_prompt(
+        self,
+        short_script: str,
+        dna: DocumentaryDNA,
+        target_duration_minutes: int
+    ) -> str:
+        """Build the 5-act expansion prompt."""
         target_words = target_duration_minutes * 150  # ~150 words/minute
         
         prompt = f"""Expand this Short script into a {target_duration_minutes}-minute documentary narration.
@@ -666,18 +1332,8 @@ RULES:
 - Write as continuous narration (no section headers in output)
 
 OUTPUT THE DOCUMENTARY SCRIPT:"""
-
-        try:
-            response = self.openai_client.chat.completions.create(
-                model="gpt-4o",
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.7,
-                max_tokens=4000
-            )
-            return response.choices[0].message.content
-        except Exception as e:
-            print(f"[LONGFORM] Script expansion error: {e}")
-            return self._fallback_expansion(short_script, dna)
+        
+        return prompt
     
     def _fallback_expansion(self, short_script: str, dna: DocumentaryDNA) -> str:
         """Fallback expansion without API."""
@@ -716,6 +1372,22 @@ async def build_documentary_from_short(short_data: Dict, audio_path: str) -> str
     return await builder.expand_to_documentary(dna, audio_path)
 
 
+async def narrate_documentary_from_short(
+    short_script: str,
+    dna: DocumentaryDNA,
+    voice: TTSVoice = TTSVoice.ANDREW,
+    target_duration_minutes: int = 15
+) -> Optional[str]:
+    """
+    Expand a Short script and voice it in one pass.
+    TTS starts on the first sentences while the LLM is still writing.
+    """
+    audio_engine = LongformAudioEngine()
+    async with DocumentaryScriptExpander() as expander:
+        sentences = expander.expand_script_sentences(short_script, dna, target_duration_minutes)
+        return await audio_engine.generate_narration_stream(sentences, voice)
+
+
 if __name__ == "__main__":
     # Test the builder
     print("Long-Form Documentary Builder v1.0")
@@ -10,14 +10,31 @@ under one central brain.
 """
 
 import os
+import re
+import random
+import string
 import json
 import asyncio
+import itertools
 from datetime import datetime, timedelta
-from typing import Optional, List, Dict
+from functools import lru_cache
+from operator import attrgetter
+from pathlib import Path
+from typing import Optional, List, Dict, Tuple, Callable, Awaitable, Iterable
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 import httpx
 
+try:
+    from engines._json import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # Run as a script from engines/
+    from _json import dumps as _json_dumps, loads as _json_loads
+
+
+# Environment is read once at import
+_YOUTUBE_API_KEY = os.getenv("YOUTUBE_API_KEY", "")
+_OWN_PRODUCT_URL = os.getenv("OWN_PRODUCT_URL", "https://solidarityointments.com")
+
 # ============================================================
 # NICHE DEFINITIONS
 # ============================================================
@@ -30,7 +47,7 @@ class Niche(Enum):
     PRODUCTIVITY = "productivity"
 
 
-@dataclass
+@dataclass(slots=True)
 class NicheConfig:
     """Configuration for a single niche channel"""
     
@@ -72,6 +89,15 @@ class NicheConfig:
     youtube_refresh_token: str = ""
 
 
+# Fields persisted by save_config; credentials and brand assets stay out of the file
+_SAVED_FIELDS = (
+    "channel_name", "channel_id", "video_frequency", "short_frequency",
+    "systeme_funnel_url", "lead_magnet_name", "own_product_url",
+    "total_videos", "total_views", "total_subscribers", "total_leads", "total_revenue",
+)
+_saved_values = attrgetter(*_SAVED_FIELDS)
+
+
 # ============================================================
 # NICHE-SPECIFIC CONTENT STRATEGIES
 # ============================================================
@@ -214,6 +240,111 @@ NICHE_STRATEGIES = {
 }
 
 
+# ============================================================
+# KEYWORD MATCHERS (compiled once from NICHE_STRATEGIES)
+# ============================================================
+
+def _alternation(words) -> str:
+    """
+    Regex matching any of `words`, factored into a prefix trie so the engine
+    follows one branch per character instead of retrying every keyword.
+    Optional tails are greedy, so the longest keyword at a position wins.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}  # End-of-word marker
+    
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{body})?" if "" in node else body
+    
+    return build(trie)
+
+
+_KEYWORD_NICHES: Dict[str, List[Niche]] = {}
+for _niche, _strategy in NICHE_STRATEGIES.items():
+    for _kw in _strategy["keywords"]:
+        _KEYWORD_NICHES.setdefault(_kw.lower(), []).append(_niche)
+
+# Zero-width lookahead so overlapping keywords are all found in one scan
+_KEYWORD_PATTERN = re.compile(f"(?=({_alternation(_KEYWORD_NICHES)}))")
+
+# Shorter keywords hidden inside a longer match ("automation" in
+# "automation income") still count, exactly like a substring check
+_KEYWORDS_WITHIN = {
+    kw: frozenset(other for other in _KEYWORD_NICHES if other in kw)
+    for kw in _KEYWORD_NICHES
+}
+
+# Own-product vocab lowercased once; callers lowercase each input keyword once
+_OWN_PRODUCT_KEYWORDS_LOWER: Dict[Niche, tuple] = {
+    niche: tuple(kw.lower() for kw in strategy.get("own_product_keywords", []))
+    for niche, strategy in NICHE_STRATEGIES.items()
+}
+
+_OWN_PRODUCT_PATTERNS: Dict[Niche, Optional[re.Pattern]] = {
+    niche: re.compile(_alternation(words)) if words else None
+    for niche, words in _OWN_PRODUCT_KEYWORDS_LOWER.items()
+}
+
+
+_NICHE_ORDER = {niche: i for i, niche in enumerate(Niche)}
+
+
+# Routing is a pure function of the text - the scheduler repeats topic sets
+@lru_cache(maxsize=4096)
+def _matched_keywords(combined_lower: str) -> frozenset:
+    """Niche keywords present in already-lowercased text (one scan)."""
+    found = set()
+    for match in _KEYWORD_PATTERN.finditer(combined_lower):
+        found |= _KEYWORDS_WITHIN[match.group(1)]
+    return frozenset(found)
+
+
+@lru_cache(maxsize=4096)
+def _best_niche(combined_lower: str) -> Niche:
+    """Highest-scoring niche for already-lowercased text."""
+    scores = dict.fromkeys(Niche, 0)
+    best_niche, best_score = Niche.SURVIVAL, 0
+    
+    # Running max; ties go to the niche declared first, as max() did
+    for keyword in _matched_keywords(combined_lower):
+        for niche in _KEYWORD_NICHES[keyword]:
+            score = scores[niche] + 1
+            scores[niche] = score
+            if score > best_score or (
+                score == best_score and _NICHE_ORDER[niche] < _NICHE_ORDER[best_niche]
+            ):
+                best_niche, best_score = niche, score
+    
+    # Default to survival if no matches
+    return best_niche
+
+
+@lru_cache(maxsize=4096)
+def _niche_scores(combined_lower: str) -> Tuple[Tuple[Niche, int], ...]:
+    """Every matching niche with its score, best first (ties in declared order)."""
+    scores: Dict[Niche, int] = {}
+    for keyword in _matched_keywords(combined_lower):
+        for niche in _KEYWORD_NICHES[keyword]:
+            scores[niche] = scores.get(niche, 0) + 1
+    return tuple(sorted(scores.items(), key=lambda item: (-item[1], _NICHE_ORDER[item[0]])))
+
+
+@lru_cache(maxsize=4096)
+def _mentions_own_product(niche: Niche, keywords: frozenset) -> bool:
+    """True if any keyword hits the niche's own-product vocabulary."""
+    pattern = _OWN_PRODUCT_PATTERNS[niche]
+    # One scan; no product keyword spans a newline, so hits stay within one keyword
+    return pattern is not None and pattern.search("\n".join(keywords).lower()) is not None
+
+
 # ============================================================
 # CHANNEL MANAGER
 # ============================================================
@@ -227,7 +358,36 @@ class ChannelManager:
     def __init__(self, config: NicheConfig):
         self.config = config
         self.strategy = NICHE_STRATEGIES[config.niche]
-        self.youtube_api_key = os.getenv("YOUTUBE_API_KEY", "")
+        # Strategy fields used on every upload, bound once
+        self._lead_magnet = self.strategy["lead_magnet"]
+        self._keywords_top5 = self.strategy["keywords"][:5]
+        self._keywords_top10 = self.strategy["keywords"][:10]
+        self._video_hooks = tuple(self.strategy["video_hooks"])
+        self._frameworks = tuple(self.strategy["content_frameworks"])
+        self._rng = random.Random()
+        # Placeholder names per hook, so each call does only the work it needs
+        self._hook_slots: List[Tuple[str, frozenset]] = [
+            (hook, frozenset(name for _, name, _, _ in string.Formatter().parse(hook) if name))
+            for hook in self._video_hooks
+        ]
+        
+        # Static halves of every description, rendered once
+        name = self.strategy["name"]
+        self._hashtag_line = ' '.join('#' + kw.replace(' ', '') for kw in self._keywords_top5)
+        self._desc_hook = f"{self._lead_magnet['hook']}\n"
+        self._desc_suffix = f"""
+
+---
+
+🔔 Subscribe for more {name} content!
+👍 Like this video if it helped you.
+💬 Comment your biggest {name.lower()} challenge.
+
+---
+
+{self._hashtag_line}
+"""
+        self.youtube_api_key = _YOUTUBE_API_KEY
         
     async def upload_video(
         self,
@@ -273,43 +433,36 @@ class ChannelManager:
     
     def _build_description(self, base_description: str) -> str:
         """Build SEO-optimized description with funnel link"""
-        lead_magnet = self.strategy["lead_magnet"]
-        
-        description = f"""{lead_magnet['hook']}
-{self.config.systeme_funnel_url}
-
----
-
-{base_description}
-
----
-
-🔔 Subscribe for more {self.strategy['name']} content!
-👍 Like this video if it helped you.
-💬 Comment your biggest {self.strategy['name'].lower()} challenge.
-
----
-
-#{''.join(['#' + kw.replace(' ', '') + ' ' for kw in self.strategy['keywords'][:5]])}
-"""
-        return description
+        # Funnel URL is read per call - config can be edited after construction
+        return (
+            self._desc_hook + self.config.systeme_funnel_url + "\n\n---\n\n"
+            + base_description + self._desc_suffix
+        )
     
     def _build_tags(self, base_tags: List[str]) -> List[str]:
-        """Build comprehensive tag list"""
-        all_tags = base_tags.copy()
-        all_tags.extend(self.strategy["keywords"][:10])
-        return list(set(all_tags))[:30]  # YouTube max 500 chars
+        """Build comprehensive tag list (caller's tags first, deduped, max 30)"""
+        seen = set()
+        tags = []
+        for tag in itertools.chain(base_tags, self._keywords_top10):
+            if tag not in seen:
+                seen.add(tag)
+                tags.append(tag)
+                if len(tags) == 30:  # YouTube max 500 chars
+                    break
+        return tags
     
     def get_video_hook(self, topic: str) -> str:
         """Get a compelling hook for the video title"""
-        import random
-        hook_template = random.choice(self.strategy["video_hooks"])
-        return hook_template.format(topic=topic, amount=random.randint(500, 5000))
+        hook_template, slots = self._rng.choice(self._hook_slots)
+        if "amount" in slots:
+            return hook_template.format(topic=topic, amount=self._rng.randint(500, 5000))
+        if slots == {"topic"} and hook_template.count("{") == 1:
+            return hook_template.replace("{topic}", topic)
+        return hook_template.format(topic=topic)
     
     def get_content_framework(self) -> str:
         """Get the recommended content framework"""
-        import random
-        return random.choice(self.strategy["content_frameworks"])
+        return self._rng.choice(self._frameworks)
     
     async def get_analytics(self, days: int = 30) -> Dict:
         """Get channel analytics for the last N days"""
@@ -330,14 +483,10 @@ class ChannelManager:
         Check if content should promote own product instead of affiliate.
         Used for Solidarity Ointments routing.
         """
-        own_keywords = self.strategy.get("own_product_keywords", [])
-        if not own_keywords or not self.config.own_product_url:
+        if not self.config.own_product_url:
             return False
             
-        for keyword in keywords:
-            if any(own_kw in keyword.lower() for own_kw in own_keywords):
-                return True
-        return False
+        return _mentions_own_product(self.config.niche, frozenset(keywords))
 
 
 # ============================================================
@@ -352,23 +501,30 @@ class MasterNicheOrchestrator:
     
     def __init__(self, config_path: str = "/data/niche_config.json"):
         self.config_path = config_path
-        self.channels: Dict[Niche, ChannelManager] = {}
+        # Configs are parsed at load; managers are built on first use
+        self._configs: Dict[Niche, NicheConfig] = {}
+        self._channels: Dict[Niche, ChannelManager] = {}
+        self._dirty = False
+        self._save_lock = asyncio.Lock()
+        self._plan_channels_cache: Optional[List[Dict]] = None
         self.load_config()
         
     def load_config(self):
-        """Load channel configurations"""
+        """Load channel configurations (managers are rebuilt from the new configs)"""
+        self._configs.clear()
+        self._channels.clear()
+        self._plan_channels_cache = None
         try:
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    data = json.load(f)
-                    for niche_str, config_data in data.items():
-                        niche = Niche(niche_str)
-                        config = NicheConfig(
-                            niche=niche,
-                            channel_name=config_data.get("channel_name", f"{niche.value.title()} Channel"),
-                            **{k: v for k, v in config_data.items() if k not in ["niche", "channel_name"]}
-                        )
-                        self.channels[niche] = ChannelManager(config)
+                data = _json_loads(Path(self.config_path).read_bytes())
+                for niche_str, config_data in data.items():
+                    niche = Niche(niche_str)
+                    config = NicheConfig(
+                        niche=niche,
+                        channel_name=config_data.get("channel_name", f"{niche.value.title()} Channel"),
+                        **{k: v for k, v in config_data.items() if k not in ["niche", "channel_name"]}
+                    )
+                    self._configs[niche] = config
             else:
                 # Initialize with defaults
                 self._initialize_default_channels()
@@ -390,91 +546,104 @@ class MasterNicheOrchestrator:
             
             # Set own product URL for relevant niches
             if niche in [Niche.WELLNESS, Niche.SURVIVAL]:
-                config.own_product_url = os.getenv("OWN_PRODUCT_URL", "https://solidarityointments.com")
+                config.own_product_url = _OWN_PRODUCT_URL
             
-            self.channels[niche] = ChannelManager(config)
+            self._configs[niche] = config
         
         self.save_config()
     
     def save_config(self):
-        """Persist channel configurations"""
+        """Persist channel configurations (atomic replace)"""
         try:
-            data = {}
-            for niche, manager in self.channels.items():
-                config = manager.config
-                data[niche.value] = {
-                    "channel_name": config.channel_name,
-                    "channel_id": config.channel_id,
-                    "video_frequency": config.video_frequency,
-                    "short_frequency": config.short_frequency,
-                    "systeme_funnel_url": config.systeme_funnel_url,
-                    "lead_magnet_name": config.lead_magnet_name,
-                    "own_product_url": config.own_product_url,
-                    "total_videos": config.total_videos,
-                    "total_views": config.total_views,
-                    "total_subscribers": config.total_subscribers,
-                    "total_leads": config.total_leads,
-                    "total_revenue": config.total_revenue
-                }
+            data = {
+                niche.value: dict(zip(_SAVED_FIELDS, _saved_values(config)))
+                for niche, config in self._configs.items()
+            }
             
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
-            with open(self.config_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            tmp_path = f"{self.config_path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(_json_dumps(data, pretty=True))
+            os.replace(tmp_path, self.config_path)
                 
         except Exception as e:
             print(f"[ORCHESTRATOR] Config save error: {e}")
     
-    def get_channel(self, niche: Niche) -> ChannelManager:
-        """Get channel manager for a specific niche"""
-        return self.channels.get(niche)
+    async def flush(self):
+        """
+        Write pending counter changes off the event loop.
+        Saves are serialized, and uploads that finish while one is in flight
+        share the next write instead of each rewriting the file.
+        """
+        async with self._save_lock:
+            if self._dirty:
+                # Cleared first so uploads during the write re-mark it
+                self._dirty = False
+                await asyncio.to_thread(self.save_config)
+    
+    def get_channel(self, niche: Niche) -> Optional[ChannelManager]:
+        """Get channel manager for a specific niche (built on first access)"""
+        if (manager := self._channels.get(niche)) is None:
+            if (config := self._configs.get(niche)) is None:
+                return None
+            manager = self._channels[niche] = ChannelManager(config)
+        return manager
+    
+    @property
+    def channels(self) -> Dict[Niche, ChannelManager]:
+        """Every configured channel's manager, in config order (built once per load)"""
+        if len(self._channels) < len(self._configs):
+            self._channels = {
+                niche: self._channels.get(niche) or ChannelManager(config)
+                for niche, config in self._configs.items()
+            }
+        return self._channels
     
     def identify_niche(self, keywords: List[str], topic: str = "") -> Niche:
         """
         Identify the best niche for given content keywords.
         Used for smart routing of generated content.
         """
-        scores = {niche: 0 for niche in Niche}
-        
         combined_text = " ".join(keywords) + " " + topic
-        combined_lower = combined_text.lower()
-        
-        for niche in Niche:
-            strategy = NICHE_STRATEGIES[niche]
-            for keyword in strategy["keywords"]:
-                if keyword.lower() in combined_lower:
-                    scores[niche] += 1
-        
-        # Return highest scoring niche
-        best_niche = max(scores, key=scores.get)
-        
-        # Default to survival if no matches
-        if scores[best_niche] == 0:
-            return Niche.SURVIVAL
-            
-        return best_niche
+        return _best_niche(combined_text.lower())
+    
+    def score_niches(self, keywords: List[str], topic: str = "") -> List[Tuple[Niche, int]]:
+        """All niches the content matches, with keyword-hit scores, best first."""
+        combined_text = " ".join(keywords) + " " + topic
+        return list(_niche_scores(combined_text.lower()))
     
     def get_routing_decision(self, keywords: List[str], topic: str = "") -> Dict:
         """
         Make intelligent routing decision for content.
         Determines niche, channel, and whether to use own product.
         """
-        niche = self.identify_niche(keywords, topic)
-        manager = self.channels[niche]
+        return self._route(keywords, topic)[1]
+    
+    def _route(
+        self,
+        keywords: List[str],
+        topic: str = "",
+        niche: Optional[Niche] = None
+    ) -> Tuple[ChannelManager, Dict]:
+        """Routing decision plus the manager it points at (one channel lookup)."""
+        niche = niche or self.identify_niche(keywords, topic)
+        if (manager := self.get_channel(niche)) is None:
+            raise KeyError(f"No channel configured for niche '{niche.value}'")
         
         # Check if should route to own product
         use_own_product = manager.should_route_to_own_product(keywords)
         
-        strategy = NICHE_STRATEGIES[niche]
+        lead_magnet = manager._lead_magnet
         
-        return {
+        return manager, {
             "niche": niche.value,
             "channel": manager.config.channel_name,
             "channel_id": manager.config.channel_id,
             "use_own_product": use_own_product,
             "product_url": manager.config.own_product_url if use_own_product else "",
             "funnel_url": manager.config.systeme_funnel_url,
-            "lead_magnet_hook": strategy["lead_magnet"]["hook"],
-            "lead_magnet_cta": strategy["lead_magnet"]["cta"],
+            "lead_magnet_hook": lead_magnet["hook"],
+            "lead_magnet_cta": lead_magnet["cta"],
             "video_hook": manager.get_video_hook(topic or keywords[0] if keywords else "this"),
             "content_framework": manager.get_content_framework()
         }
@@ -491,9 +660,52 @@ class MasterNicheOrchestrator:
         Distribute content to the appropriate channel.
         Automatically routes based on content keywords.
         """
-        routing = self.get_routing_decision(keywords)
-        niche = Niche(routing["niche"])
-        manager = self.channels[niche]
+        result = await self._upload_routed(video_path, title, description, keywords, tags)
+        self._dirty = True
+        await self.flush()
+        
+        return result
+    
+    async def cross_post_content(
+        self,
+        video_path: str,
+        title: str,
+        description: str,
+        keywords: List[str],
+        tags: List[str],
+        min_score: int = 2
+    ) -> List[Dict]:
+        """
+        Distribute content to every channel whose niche scores at least
+        min_score (falls back to the single best niche). Uploads run
+        concurrently, so latency is the slowest channel, not the sum.
+        """
+        winners = [
+            niche for niche, score in self.score_niches(keywords)
+            if score >= min_score and niche in self._configs
+        ] or [self.identify_niche(keywords)]
+        
+        results = await asyncio.gather(*(
+            self._upload_routed(video_path, title, description, keywords, tags, niche)
+            for niche in winners
+        ))
+        # One save for the whole fan-out
+        self._dirty = True
+        await self.flush()
+        
+        return list(results)
+    
+    async def _upload_routed(
+        self,
+        video_path: str,
+        title: str,
+        description: str,
+        keywords: List[str],
+        tags: List[str],
+        niche: Optional[Niche] = None
+    ) -> Dict:
+        """Route to one channel and upload with the niche's funnel header."""
+        manager, routing = self._route(keywords, niche=niche)
         
         # Enhance description with routing info
         enhanced_description = f"""{routing['lead_magnet_hook']}
@@ -513,8 +725,6 @@ class MasterNicheOrchestrator:
         )
         
         result["routing"] = routing
-        self.save_config()
-        
         return result
     
     async def get_all_analytics(self, days: int = 30) -> Dict:
@@ -529,8 +739,12 @@ class MasterNicheOrchestrator:
             "by_niche": {}
         }
         
-        for niche, manager in self.channels.items():
-            analytics = await manager.get_analytics(days)
+        channels = self.channels
+        results = await asyncio.gather(
+            *(manager.get_analytics(days) for manager in channels.values())
+        )
+        
+        for niche, analytics in zip(channels.keys(), results):
             combined["by_niche"][niche.value] = analytics
             combined["total_views"] += analytics["views"]
             combined["total_subscribers"] += analytics["subscribers"]
@@ -545,28 +759,102 @@ class MasterNicheOrchestrator:
         Generate daily content plan for all channels.
         Used by n8n scheduler.
         """
-        plan = {
+        if self._plan_channels_cache is None:
+            self._plan_channels_cache = self._build_plan_channels()
+        
+        # Config fields stay live; only strategy-derived lists come from the skeleton
+        return {
             "date": datetime.utcnow().isoformat(),
-            "channels": []
+            "channels": [
+                {
+                    "niche": static["niche"],
+                    "channel": config.channel_name,
+                    "shorts_to_create": config.short_frequency,
+                    "videos_to_create": config.video_frequency,
+                    "recommended_topics": static["recommended_topics"],
+                    "funnel_url": config.systeme_funnel_url,
+                    "subreddits_to_monitor": static["subreddits_to_monitor"]
+                }
+                for static, config in zip(self._plan_channels_cache, self._configs.values())
+            ]
         }
-        
-        for niche, manager in self.channels.items():
-            config = manager.config
+    
+    def _build_plan_channels(self) -> List[Dict]:
+        """
+        Per-channel plan fields that come from NICHE_STRATEGIES, never from
+        a NicheConfig, so in-process config edits can't go stale here
+        (rebuilt on config load, when the set of niches can change).
+        """
+        skeleton = []
+        for niche in self._configs:
             strategy = NICHE_STRATEGIES[niche]
             
-            channel_plan = {
+            skeleton.append({
                 "niche": niche.value,
-                "channel": config.channel_name,
-                "shorts_to_create": config.short_frequency,
-                "videos_to_create": config.video_frequency,
                 "recommended_topics": strategy["keywords"][:3],
-                "funnel_url": config.systeme_funnel_url,
                 "subreddits_to_monitor": strategy["subreddits"][:3]
-            }
-            
-            plan["channels"].append(channel_plan)
+            })
         
-        return plan
+        return skeleton
+    
+    async def run_all_niches(self, pipeline: "NichePipeline") -> Dict[str, Dict]:
+        """Run one production pipeline per channel, concurrently."""
+        results = await run_all_niches(
+            list(self._configs.values()),
+            pipeline
+        )
+        # Counters changed under the pipelines; save off the event loop
+        self._dirty = True
+        await self.flush()
+        return results
+
+
+# ============================================================
+# CONCURRENT NICHE RUNNER
+# ============================================================
+
+@dataclass(slots=True)
+class StageLimits:
+    """
+    Shared per-stage capacity for niche pipelines running side by side.
+    A pipeline holds the matching semaphore only while inside that stage,
+    so a niche waiting on ffmpeg never blocks another niche's script call.
+    """
+    
+    openai: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(8))
+    tts: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(4))
+    ffmpeg: asyncio.Semaphore = field(default_factory=lambda: asyncio.Semaphore(2))  # Consumer NVENC session cap
+
+
+NichePipeline = Callable[[ChannelManager, StageLimits], Awaitable[Dict]]
+
+
+async def run_all_niches(
+    configs: Iterable[NicheConfig],
+    pipeline: NichePipeline,
+    limits: Optional[StageLimits] = None
+) -> Dict[str, Dict]:
+    """
+    Run `pipeline` for every niche at once under shared stage limits.
+    One failing niche is reported in its slot and never cancels the others.
+    """
+    limits = limits or StageLimits()
+    managers = [ChannelManager(config) for config in configs]
+    
+    outcomes = await asyncio.gather(
+        *[pipeline(manager, limits) for manager in managers],
+        return_exceptions=True
+    )
+    
+    results = {}
+    for manager, outcome in zip(managers, outcomes):
+        niche = manager.config.niche.value
+        if isinstance(outcome, BaseException):
+            print(f"[ORCHESTRATOR] {niche} pipeline failed: {outcome}")
+            outcome = {"success": False, "niche": niche, "error": str(outcome)}
+        results[niche] = outcome
+    
+    return results
 
 
 # ============================================================
@@ -16,13 +16,41 @@ MINIMAL WORK because:
 """
 
 import os
+import re
+import sys
+import copy
 import json
+import shutil
+import asyncio
+import functools
+import threading
 import subprocess
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime
 
+try:
+    from engines.hw_encoder import (
+        detect_hw_encoder,
+        hw_device_args as _hw_device_args,
+        pixel_format_filter as _pixel_format_filter,
+    )
+except ImportError:  # Run as a script from engines/
+    from hw_encoder import (
+        detect_hw_encoder,
+        hw_device_args as _hw_device_args,
+        pixel_format_filter as _pixel_format_filter,
+    )
+
+try:
+    from engines._json import dumps as _json_dumps, loads as _json_loads
+except ImportError:  # Run as a script from engines/
+    from _json import dumps as _json_dumps, loads as _json_loads
+
 
 @dataclass
 class AssemblyConfig:
@@ -38,6 +66,98 @@ class AssemblyConfig:
     add_branding: bool = False
     brand_intro_path: Optional[str] = None
     brand_outro_path: Optional[str] = None
+    hw_encoder: Optional[str] = "auto"  # "auto", an ffmpeg encoder name, or None for libx264
+
+
+@functools.cache
+def _ffmpeg_available() -> bool:
+    """True if an ffmpeg binary runs (checked once per process)."""
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-version"],
+            capture_output=True,
+            text=True
+        )
+        return result.returncode == 0
+    except FileNotFoundError:
+        return False
+
+
+_CLIP_INDEX = re.compile(r"clip_(\d+)")
+
+
+def _clip_order(path: Path) -> Tuple[int, str]:
+    """Numeric clip order (clip_2 before clip_10); unnumbered names last."""
+    match = _CLIP_INDEX.match(path.stem)
+    return (int(match.group(1)) if match else sys.maxsize, path.stem)
+
+
+def _write_concat_list(paths: List[Path], output_path: Path):
+    """Write an ffmpeg concat-demuxer list in a single write."""
+    # ffmpeg concat requires forward slashes
+    output_path.write_text("".join(
+        f"file '{str(path.absolute()).replace(chr(92), '/')}'\n" for path in paths
+    ))
+
+
+# Stderr lines kept from each ffmpeg run (for error reports)
+FFMPEG_LOG_TAIL = 200
+
+
+def _run_ffmpeg(cmd: List[str]) -> Tuple[int, str]:
+    """
+    Run ffmpeg, draining stderr on a thread into a bounded buffer so long
+    encodes don't hold their whole progress log in memory.
+    Returns (returncode, last FFMPEG_LOG_TAIL lines of stderr).
+    """
+    process = subprocess.Popen(
+        cmd,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+        text=True,
+        errors="replace"
+    )
+    tail: deque = deque(maxlen=FFMPEG_LOG_TAIL)
+    drain = threading.Thread(target=tail.extend, args=(process.stderr,), daemon=True)
+    drain.start()
+    returncode = process.wait()
+    drain.join()
+    process.stderr.close()
+    return returncode, "".join(tail)
+
+
+# ============================================================
+# ENCODER SELECTION (GPU when available, libx264 fallback)
+# ============================================================
+
+# Video stream parameters that must match across clips for a copy concat
+_COPY_COMPAT_KEYS = ("codec_name", "width", "height", "pix_fmt", "r_frame_rate")
+
+# Concurrent ffprobe processes when inspecting clips
+PROBE_WORKERS = 8
+
+# Shortest body or crossfade worth rendering as its own segment (seconds)
+MIN_SEGMENT_SECONDS = 0.05
+
+
+def _resolve_encoder(config: AssemblyConfig) -> str:
+    """Encoder named by the config, detecting hardware for "auto"."""
+    if config.hw_encoder == "auto":
+        return detect_hw_encoder()
+    return config.hw_encoder or "libx264"
+
+
+def _video_encoder_args(encoder: str) -> List[str]:
+    """Constant-quality settings roughly matching libx264 CRF 23."""
+    if encoder == "h264_nvenc":
+        return ["-c:v", "h264_nvenc", "-preset", "p4", "-rc", "vbr", "-cq", "23", "-b:v", "0"]
+    if encoder == "h264_qsv":
+        return ["-c:v", "h264_qsv", "-preset", "fast", "-global_quality", "23"]
+    if encoder == "h264_vaapi":
+        return ["-c:v", "h264_vaapi", "-qp", "23"]
+    if encoder == "h264_videotoolbox":
+        return ["-c:v", "h264_videotoolbox", "-b:v", "8M"]
+    return ["-c:v", "libx264", "-preset", "fast", "-crf", "23"]
 
 
 class OmniAssembler:
@@ -55,16 +175,29 @@ class OmniAssembler:
         """
         self.opal_dir = Path(opal_output_dir)
         self.clips_dir = self.opal_dir / "clips"
-        
-        # Load OPAL intelligence
-        self.metadata = self._load_json("metadata.json")
-        self.prompts = self._load_json("prompts.json")
-        self.failures = self._load_json("failure_log.json")
+        self._clips_cache: Optional[tuple] = None  # (clips/ mtime, sorted clips)
+        self._probe_lock = threading.Lock()
+        self._analysis_cache: Optional[tuple] = None  # (clips/ mtime, analysis)
         
         # Validate
         if not self.clips_dir.exists():
             raise ValueError(f"No clips directory found at {self.clips_dir}")
-            
+    
+    # OPAL intelligence - each file is parsed on first use only
+    @cached_property
+    def metadata(self) -> Dict:
+        return self._load_json("metadata.json")
+    
+    @cached_property
+    def prompts(self) -> Dict:
+        return self._load_json("prompts.json")
+    
+    @cached_property
+    def failures(self) -> Dict:
+        return self._load_json("failure_log.json")
+    
+    def describe(self):
+        """Print a short summary of the loaded OPAL run."""
         print(f"📦 Loaded OPAL output: {self.opal_dir.name}")
         print(f"   Clips: {self.metadata.get('successful_clips', 0)}")
         print(f"   Mode: {self.metadata.get('operating_mode', 'UNKNOWN')}")
@@ -73,26 +206,92 @@ class OmniAssembler:
         """Load a JSON file from OPAL output."""
         path = self.opal_dir / filename
         if path.exists():
-            with open(path) as f:
-                return json.load(f)
+            return _json_loads(path.read_bytes())
         return {}
     
     def _get_clip_files(self) -> List[Path]:
-        """Get all clip files in order."""
-        clips = sorted(self.clips_dir.glob("clip_*.mp4"))
-        return clips
+        """Get all clip files in order (re-globbed only when clips/ changes)."""
+        mtime = self.clips_dir.stat().st_mtime
+        if self._clips_cache is None or self._clips_cache[0] != mtime:
+            self._clips_cache = (mtime, sorted(self.clips_dir.glob("clip_*.mp4"), key=_clip_order))
+        return list(self._clips_cache[1])
     
-    def _check_ffmpeg(self) -> bool:
-        """Verify ffmpeg is available."""
+    def _probe_one(self, clip: Path) -> Optional[Dict[str, Any]]:
+        """
+        Duration (seconds), audio presence and the video stream parameters
+        that must match for a stream-copy concat, via ffprobe (None if
+        unavailable).
+        """
         try:
             result = subprocess.run(
-                ["ffmpeg", "-version"],
+                [
+                    "ffprobe", "-v", "error",
+                    "-show_entries",
+                    "format=duration:stream=codec_type,codec_name,width,height,pix_fmt,r_frame_rate",
+                    "-of", "json", str(clip)
+                ],
                 capture_output=True,
                 text=True
             )
-            return result.returncode == 0
-        except FileNotFoundError:
-            return False
+            info = json.loads(result.stdout)
+            streams = info.get("streams", [])
+            video = next((st for st in streams if st.get("codec_type") == "video"), {})
+            return {
+                "duration": float(info["format"]["duration"]),
+                "has_audio": any(st.get("codec_type") == "audio" for st in streams),
+                "video": [video.get(key) for key in _COPY_COMPAT_KEYS]
+            }
+        except (FileNotFoundError, ValueError, KeyError):
+            return None
+    
+    def _probe_all(self, clips: List[Path]) -> Dict[Path, Dict[str, Any]]:
+        """
+        Per-clip duration and audio presence, cached in probes.json by
+        (mtime, size) so reassembly of the same OPAL run skips ffprobe
+        entirely. Stale clips are probed concurrently (ffprobe cost is
+        process startup).
+        """
+        # Assembly and the report can probe at once; the second waits and hits the cache
+        with self._probe_lock:
+            probes = self._load_json("probes.json")
+            default = {
+                "duration": float(self.metadata.get("duration_per_clip", 8.0)),
+                "has_audio": False,
+                "video": None
+            }
+            
+            results: Dict[Path, Dict[str, Any]] = {}
+            stale = []
+            for clip in clips:
+                stat = clip.stat()
+                entry = probes.get(str(clip.absolute()))
+                if (
+                    entry and "video" in entry
+                    and entry.get("mtime") == stat.st_mtime and entry.get("size") == stat.st_size
+                ):
+                    results[clip] = entry
+                else:
+                    stale.append((clip, stat))
+            
+            if stale:
+                with ThreadPoolExecutor(max_workers=min(PROBE_WORKERS, len(stale))) as executor:
+                    probed = list(executor.map(self._probe_one, [clip for clip, _ in stale]))
+                
+                for (clip, stat), info in zip(stale, probed):
+                    if info is None:
+                        results[clip] = default
+                        continue
+                    results[clip] = probes[str(clip.absolute())] = {
+                        "mtime": stat.st_mtime, "size": stat.st_size, **info
+                    }
+                
+                (self.opal_dir / "probes.json").write_bytes(_json_dumps(probes, pretty=True))
+            
+            return results
+    
+    def _check_ffmpeg(self) -> bool:
+        """Verify ffmpeg is available."""
+        return _ffmpeg_available()
     
     def analyze_clips(self) -> Dict[str, Any]:
         """
@@ -101,12 +300,18 @@ class OmniAssembler:
         Returns:
             Analysis with clip inventory, duration estimates, and recommendations
         """
+        # Reused until clips/ changes (the report re-asks after assembly);
+        # callers get their own copy so edits never leak into the cache
+        mtime = self.clips_dir.stat().st_mtime
+        if self._analysis_cache is not None and self._analysis_cache[0] == mtime:
+            return copy.deepcopy(self._analysis_cache[1])
+        
         clips = self._get_clip_files()
-        clip_duration = self.metadata.get("duration_per_clip", 8.0)
+        probes = self._probe_all(clips)
         
         analysis = {
             "total_clips": len(clips),
-            "estimated_duration": len(clips) * clip_duration,
+            "estimated_duration": round(sum(p["duration"] for p in probes.values()), 2),
             "clips_available": [c.stem for c in clips],
             "failed_clips": list(self.failures.keys()),
             "recovery_stats": {
@@ -131,6 +336,7 @@ class OmniAssembler:
                 f"⚠️ {analysis['recovery_stats']['failed']} clips failed - consider placeholders or re-run"
             )
             
+        self._analysis_cache = (mtime, copy.deepcopy(analysis))
         return analysis
     
     def generate_concat_file(self, output_path: Optional[Path] = None) -> Path:
@@ -148,11 +354,7 @@ class OmniAssembler:
         if output_path is None:
             output_path = self.opal_dir / "concat.txt"
             
-        with open(output_path, "w") as f:
-            for clip in clips:
-                # ffmpeg concat requires forward slashes and escaped quotes
-                clip_path = str(clip.absolute()).replace("\\", "/")
-                f.write(f"file '{clip_path}'\n")
+        _write_concat_list(clips, output_path)
                 
         print(f"📝 Generated concat file: {output_path}")
         return output_path
@@ -181,37 +383,168 @@ class OmniAssembler:
         if not clips:
             raise ValueError("No clips available for assembly")
             
-        # Generate concat file
-        concat_file = self.generate_concat_file()
-        
         # Output path
         if output_path is None:
             output_path = self.opal_dir / f"{config.output_name}.{config.output_format}"
         else:
             output_path = Path(output_path)
             
-        # Build ffmpeg command
+        probes = self._probe_all(clips)
+        signatures = {tuple(p["video"]) if p["video"] else None for p in probes.values()}
+        
+        if len(signatures) > 1:
+            # Mixed sources - a stream copy would silently produce broken output
+            print("⚠️ Clips differ in codec/size/format - re-encoding")
+            cmd = self._reencode_concat_cmd(clips, probes, output_path, config)
+        else:
+            # Generate concat file
+            concat_file = self.generate_concat_file()
+            
+            # Build ffmpeg command
+            cmd = [
+                "ffmpeg",
+                "-y",  # Overwrite
+                "-f", "concat",
+                "-safe", "0",
+                "-i", str(concat_file),
+                "-c", "copy",  # Stream copy (fast, no re-encode)
+                str(output_path)
+            ]
+        
+        print(f"\n🎬 Assembling {len(clips)} clips...")
+        print(f"   Output: {output_path}")
+        
+        returncode, log = _run_ffmpeg(cmd)
+        
+        if returncode == 0:
+            print(f"✅ Assembly complete: {output_path}")
+            return output_path
+        else:
+            print(f"❌ Assembly failed: {log[-200:]}")
+            raise RuntimeError(f"ffmpeg failed: {log}")
+    
+    def _reencode_concat_cmd(
+        self,
+        clips: List[Path],
+        probes: Dict[Path, Dict[str, Any]],
+        output_path: Path,
+        config: AssemblyConfig,
+        music_path: Optional[str] = None
+    ) -> List[str]:
+        """
+        Concat-filter command that normalizes every clip to the first
+        clip's size and frame rate, encoded with the configured encoder.
+        With music_path, the music replaces the clips' audio.
+        """
+        reference = next((p["video"] for p in probes.values() if p["video"]), None)
+        _, width, height, _, frame_rate = reference or [None, 1920, 1080, None, "30"]
+        audio = music_path is None and all(p["has_audio"] for p in probes.values())
+        encoder = _resolve_encoder(config)
+        
+        inputs = []
+        filter_parts = []
+        concat_inputs = ""
+        for i, clip in enumerate(clips):
+            inputs.extend(["-i", str(clip)])
+            filter_parts.append(
+                f"[{i}:v]scale={width}:{height}:force_original_aspect_ratio=decrease,"
+                f"pad={width}:{height}:(ow-iw)/2:(oh-ih)/2,setsar=1,"
+                f"fps={frame_rate},format=yuv420p[v{i}]"
+            )
+            concat_inputs += f"[v{i}]"
+            if audio:
+                filter_parts.append(
+                    f"[{i}:a]aformat=sample_rates=44100:channel_layouts=stereo[a{i}]"
+                )
+                concat_inputs += f"[a{i}]"
+        
+        filter_parts.append(
+            f"{concat_inputs}concat=n={len(clips)}:v=1:a={int(audio)}[cv]" + ("[outa]" if audio else "")
+        )
+        filter_parts.append(f"[cv]null{_pixel_format_filter(encoder)}[outv]")
+        if music_path is not None:
+            inputs.extend(["-i", str(music_path)])
+            filter_parts.append(f"[{len(clips)}:a]volume={config.music_volume}[outa]")
+        
         cmd = [
             "ffmpeg",
-            "-y",  # Overwrite
-            "-f", "concat",
-            "-safe", "0",
-            "-i", str(concat_file),
-            "-c", "copy",  # Stream copy (fast, no re-encode)
-            str(output_path)
+            "-y",
+            *_hw_device_args(encoder),
+            *inputs,
+            "-filter_complex", ";".join(filter_parts),
+            "-map", "[outv]",
+            *_video_encoder_args(encoder)
         ]
+        if audio:
+            cmd += ["-map", "[outa]", "-c:a", "aac", "-b:a", "128k"]
+        elif music_path is not None:
+            cmd += ["-map", "[outa]", "-c:a", "aac", "-shortest"]
+        cmd.append(str(output_path))
+        return cmd
+    
+    def assemble_with_music(
+        self,
+        music_path: str,
+        output_path: Optional[str] = None,
+        config: Optional[AssemblyConfig] = None
+    ) -> Path:
+        """
+        Concatenate clips and lay a music track under them in one ffmpeg pass.
         
-        print(f"\n🎬 Assembling {len(clips)} clips...")
+        Same result as assemble_simple() followed by add_audio_track(),
+        without writing and re-reading the intermediate video.
+        """
+        if not self._check_ffmpeg():
+            raise RuntimeError("ffmpeg not found. Please install ffmpeg.")
+            
+        config = config or AssemblyConfig()
+        clips = self._get_clip_files()
+        
+        if not clips:
+            raise ValueError("No clips available for assembly")
+            
+        if output_path is None:
+            output_path = self.opal_dir / f"{config.output_name}_with_audio.{config.output_format}"
+        else:
+            output_path = Path(output_path)
+            
+        probes = self._probe_all(clips)
+        signatures = {tuple(p["video"]) if p["video"] else None for p in probes.values()}
+        
+        if len(signatures) > 1:
+            # Mixed sources - a stream copy would silently produce broken output
+            print("⚠️ Clips differ in codec/size/format - re-encoding")
+            cmd = self._reencode_concat_cmd(clips, probes, output_path, config, music_path)
+        else:
+            concat_file = self.generate_concat_file()
+            
+            cmd = [
+                "ffmpeg",
+                "-y",
+                "-f", "concat",
+                "-safe", "0",
+                "-i", str(concat_file),
+                "-i", str(music_path),
+                "-filter_complex", f"[1:a]volume={config.music_volume}[a]",
+                "-map", "0:v",
+                "-map", "[a]",
+                "-c:v", "copy",
+                "-c:a", "aac",
+                "-shortest",
+                str(output_path)
+            ]
+        
+        print(f"\n🎬 Assembling {len(clips)} clips with music...")
         print(f"   Output: {output_path}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        returncode, log = _run_ffmpeg(cmd)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"✅ Assembly complete: {output_path}")
             return output_path
         else:
-            print(f"❌ Assembly failed: {result.stderr[:200]}")
-            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
+            print(f"❌ Assembly failed: {log[-200:]}")
+            raise RuntimeError(f"ffmpeg failed: {log}")
     
     def assemble_with_transitions(
         self,
@@ -219,9 +552,11 @@ class OmniAssembler:
         config: Optional[AssemblyConfig] = None
     ) -> Path:
         """
-        Assembly with crossfade transitions using ffmpeg filter_complex.
+        Assembly with crossfade transitions.
         
-        This is slower but produces smoother results.
+        Only the clip bodies and the short overlaps are encoded, as
+        independent ffmpeg processes running side by side; the pieces are
+        then joined with a stream-copy concat.
         """
         if not self._check_ffmpeg():
             raise RuntimeError("ffmpeg not found. Please install ffmpeg.")
@@ -242,59 +577,118 @@ class OmniAssembler:
         else:
             output_path = Path(output_path)
             
-        # Build complex filter for crossfades
-        inputs = []
-        for i, clip in enumerate(clips):
-            inputs.extend(["-i", str(clip)])
-            
-        # Build filter graph
-        filter_parts = []
-        current_output = "[0:v]"
+        probes = self._probe_all(clips)
+        durations = {clip: probe["duration"] for clip, probe in probes.items()}
+        # Carry audio through (crossfaded) only when every clip has a track
+        audio = all(probe["has_audio"] for probe in probes.values())
+        encoder = _resolve_encoder(config)
+        td = config.transition_duration
         
-        for i in range(1, len(clips)):
-            next_input = f"[{i}:v]"
-            output_label = f"[v{i}]" if i < len(clips) - 1 else "[outv]"
-            
-            filter_parts.append(
-                f"{current_output}{next_input}xfade=transition={config.transition_type}:"
-                f"duration={config.transition_duration}:offset={i * 7.7}{output_label}"
-            )
-            current_output = output_label
-            
-        filter_complex = ";".join(filter_parts)
+        # Each overlap is clamped so a short clip is never consumed by its
+        # two transitions; one too short to render becomes a hard cut.
+        overlaps = []
+        for clip, next_clip in zip(clips, clips[1:]):
+            overlap = min(td, durations[clip] / 2, durations[next_clip] / 2)
+            overlaps.append(overlap if overlap >= MIN_SEGMENT_SECONDS else 0.0)
         
-        cmd = [
-            "ffmpeg",
-            "-y",
-            *inputs,
-            "-filter_complex", filter_complex,
-            "-map", "[outv]",
-            "-c:v", "libx264",
-            "-preset", "fast",
-            "-crf", "23",
-            str(output_path)
-        ]
+        # Split the timeline into independent renders: each clip's body
+        # (minus the overlaps) and one short xfade per adjacent pair.
+        # They encode in parallel and are joined with a stream-copy concat.
+        segments_dir = self.opal_dir / "segments"
+        segments_dir.mkdir(exist_ok=True)
+        jobs = []
+        for i, clip in enumerate(clips):
+            start = overlaps[i - 1] if i > 0 else 0.0
+            end = durations[clip] - overlaps[i] if i < len(overlaps) else durations[clip]
+            if end - start >= MIN_SEGMENT_SECONDS:
+                jobs.append(self._segment_cmd(
+                    [clip], segments_dir / f"body_{i:04d}.mp4", encoder,
+                    seek=start, length=end - start, audio=audio
+                ))
+            if i < len(overlaps) and overlaps[i]:
+                overlap = overlaps[i]
+                jobs.append(self._segment_cmd(
+                    [clip, clips[i + 1]], segments_dir / f"xfade_{i:04d}.mp4", encoder,
+                    seek=durations[clip] - overlap, length=overlap, audio=audio,
+                    filter_complex=(
+                        f"[0:v][1:v]xfade=transition={config.transition_type}:"
+                        f"duration={overlap}:offset=0{_pixel_format_filter(encoder)}[outv]"
+                        + (f";[0:a][1:a]acrossfade=d={overlap}[outa]" if audio else "")
+                    )
+                ))
+        
+        segment_list = segments_dir / "segments.txt"
+        _write_concat_list([Path(cmd[-1]) for cmd in jobs], segment_list)
         
         print(f"\n🎬 Assembling {len(clips)} clips with {config.transition_type} transitions...")
         print(f"   Output: {output_path}")
         
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        workers = max(1, (os.cpu_count() or 2) // 2)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_run_ffmpeg, jobs))
+        
+        returncode, log = next(((rc, log) for rc, log in results if rc != 0), (0, ""))
+        if returncode == 0:
+            returncode, log = _run_ffmpeg([
+                "ffmpeg", "-y",
+                "-f", "concat", "-safe", "0",
+                "-i", str(segment_list),
+                "-c", "copy",
+                str(output_path)
+            ])
         
-        if result.returncode == 0:
+        shutil.rmtree(segments_dir, ignore_errors=True)
+        
+        if returncode == 0:
             print(f"✅ Assembly complete: {output_path}")
             return output_path
         else:
-            print(f"❌ Assembly failed: {result.stderr[:500]}")
+            print(f"❌ Assembly failed: {log[-500:]}")
             # Fallback to simple assembly
             print("⚠️ Falling back to simple concatenation...")
             return self.assemble_simple(output_path, config)
     
+    def _segment_cmd(
+        self,
+        inputs: List[Path],
+        output_path: Path,
+        encoder: str,
+        seek: float,
+        length: float,
+        audio: bool = False,
+        filter_complex: Optional[str] = None
+    ) -> List[str]:
+        """
+        ffmpeg command rendering one segment of a transition assembly.
+        The first input is read from `seek`; later inputs from their start.
+        """
+        cmd = ["ffmpeg", "-y", *_hw_device_args(encoder)]
+        cmd += ["-ss", f"{seek:.3f}", "-t", f"{length:.3f}", "-i", str(inputs[0])]
+        for clip in inputs[1:]:
+            cmd += ["-t", f"{length:.3f}", "-i", str(clip)]
+        
+        if filter_complex:
+            cmd += ["-filter_complex", filter_complex, "-map", "[outv]"]
+            if audio:
+                cmd += ["-map", "[outa]"]
+        else:
+            cmd += ["-map", "0:v", "-vf", "null" + _pixel_format_filter(encoder)]
+            if audio:
+                cmd += ["-map", "0:a"]
+        
+        # Identical encoder settings on every segment keep the concat copy valid
+        cmd += _video_encoder_args(encoder)
+        cmd += ["-c:a", "aac", "-b:a", "128k"] if audio else ["-an"]
+        cmd.append(str(output_path))
+        return cmd
+    
     def add_audio_track(
         self,
         video_path: str,
         audio_path: str,
         output_path: Optional[str] = None,
-        audio_volume: float = 0.3
+        audio_volume: float = 0.3,
+        mix: bool = False
     ) -> Path:
         """
         Add an audio track to the assembled video.
@@ -304,6 +698,8 @@ class OmniAssembler:
             audio_path: Path to the audio file (mp3, wav, etc.)
             output_path: Where to save the result
             audio_volume: Volume level for the audio (0.0 - 1.0)
+            mix: Lay the track under the video's own audio instead of
+                replacing it (no-op when the video is silent)
             
         Returns:
             Path to the video with audio
@@ -319,12 +715,19 @@ class OmniAssembler:
         else:
             output_path = Path(output_path)
             
+        audio_filter = f"[1:a]volume={audio_volume}[a]"
+        if mix and (probe := self._probe_one(video_path)) and probe["has_audio"]:
+            audio_filter = (
+                f"[1:a]volume={audio_volume}[music];"
+                "[0:a][music]amix=inputs=2:duration=first:normalize=0[a]"
+            )
+        
         cmd = [
             "ffmpeg",
             "-y",
             "-i", str(video_path),
             "-i", str(audio_path),
-            "-filter_complex", f"[1:a]volume={audio_volume}[a]",
+            "-filter_complex", audio_filter,
             "-map", "0:v",
             "-map", "[a]",
             "-c:v", "copy",
@@ -334,14 +737,14 @@ class OmniAssembler:
         ]
         
         print(f"\n🎵 Adding audio track...")
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        returncode, log = _run_ffmpeg(cmd)
         
-        if result.returncode == 0:
+        if returncode == 0:
             print(f"✅ Audio added: {output_path}")
             return output_path
         else:
-            print(f"❌ Failed to add audio: {result.stderr[:200]}")
-            raise RuntimeError(f"ffmpeg failed: {result.stderr}")
+            print(f"❌ Failed to add audio: {log[-200:]}")
+            raise RuntimeError(f"ffmpeg failed: {log}")
     
     def export_assembly_report(self, output_path: Optional[str] = None) -> Path:
         """
@@ -366,8 +769,7 @@ class OmniAssembler:
         else:
             output_path = Path(output_path)
             
-        with open(output_path, "w") as f:
-            json.dump(report, f, indent=2)
+        output_path.write_bytes(_json_dumps(report, pretty=True))
             
         print(f"📊 Assembly report: {output_path}")
         return output_path
@@ -399,7 +801,7 @@ def main():
     )
     parser.add_argument(
         "--music",
-        help="Path to music/audio file to add"
+        help="Path to music/audio file to add (replaces clip audio; mixed under it with --transitions)"
     )
     parser.add_argument(
         "--analyze-only",
@@ -410,6 +812,7 @@ def main():
     args = parser.parse_args()
     
     assembler = OmniAssembler(args.opal_dir)
+    assembler.describe()
     
     if args.analyze_only:
         analysis = assembler.analyze_clips()
@@ -419,20 +822,36 @@ def main():
             print(f"  {key}: {value}")
         return
         
-    # Assemble
+    video_path = asyncio.run(_assemble_and_report(assembler, args))
+    
+    print(f"\n🎉 Final video: {video_path}")
+
+
+async def _assemble_and_report(assembler: OmniAssembler, args) -> Path:
+    """
+    Run assembly and the report side by side - the report's clip analysis
+    (ffprobe) doesn't need the output video, so it overlaps the encode.
+    """
+    # Assemble (plain concat + music is a single ffmpeg pass)
     if args.transitions:
-        video_path = assembler.assemble_with_transitions(args.output)
+        assemble = functools.partial(assembler.assemble_with_transitions, args.output)
+    elif args.music:
+        assemble = functools.partial(assembler.assemble_with_music, args.music, args.output)
     else:
-        video_path = assembler.assemble_simple(args.output)
-        
-    # Add music if specified
-    if args.music:
-        video_path = assembler.add_audio_track(str(video_path), args.music)
-        
-    # Export report
-    assembler.export_assembly_report()
+        assemble = functools.partial(assembler.assemble_simple, args.output)
     
-    print(f"\n🎉 Final video: {video_path}")
+    video_path, _ = await asyncio.gather(
+        asyncio.to_thread(assemble),
+        asyncio.to_thread(assembler.export_assembly_report)
+    )
+    
+    # Music over transitions needs the finished video; keep the crossfaded clip audio
+    if args.transitions and args.music:
+        video_path = await asyncio.to_thread(
+            assembler.add_audio_track, str(video_path), args.music, mix=True
+        )
+    
+    return video_path
 
 
 if __name__ == "__main__":
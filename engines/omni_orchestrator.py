@@ -14,15 +14,23 @@ This is the "Brain Stem" - the meta-controller that:
 """
 
 import os
+import re
 import json
+import time
+import heapq
+import atexit
 import asyncio
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any, Callable
+import threading
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Any, Callable, Tuple, Sequence
 from pathlib import Path
 from enum import Enum
 import httpx
+import numpy as np
 from dataclasses import dataclass, field, asdict
 import hashlib
+from collections import deque
+from itertools import islice
 
 # Import all engines
 from .hunter import MasterHunter
@@ -31,6 +39,22 @@ from .gatherer import MasterGatherer
 from .businessman import MasterBusinessman
 from .survivor import MasterSurvivor, AlertManager, ErrorTracker
 
+from ._json import dumps as _json_dumps, loads as _json_loads
+
+
+def _group_totals(keys: List[Any], *columns: List[float]) -> Dict[Any, List[float]]:
+    """Per-key [count, sum of each column], in first-seen key order"""
+    index: Dict[Any, int] = {}
+    codes = [index.setdefault(key, len(index)) for key in keys]
+    if not codes:
+        return {}
+    
+    size = len(index)
+    rows = [np.bincount(codes, minlength=size).tolist()]
+    rows += [np.bincount(codes, weights=col, minlength=size).tolist() for col in columns]
+    
+    return {key: [row[code] for row in rows] for key, code in index.items()}
+
 
 # ============================================================
 # SYSTEM STATES
@@ -106,6 +130,8 @@ class OmniConfig:
         "auto_retry_failed_uploads": True,
         "max_auto_fix_attempts": 3,
         "fix_cooldown_seconds": 120,
+        "repair_interval_seconds": 5,      # Repair loop sleep after finding issues
+        "max_repair_interval_seconds": 300,# Idle backoff cap
     })
     
     # Niche priorities (dynamically adjusted based on performance)
@@ -143,38 +169,261 @@ class OmniConfig:
 # PERFORMANCE TRACKER - The Memory
 # ============================================================
 
+# Error-message classifiers: applied once when an error is recorded,
+# and by the healer to a diagnosis' sample errors
+_AUTH_RE = re.compile(r'401|auth', re.I)
+_RATE_RE = re.compile(r'429|rate|throttl', re.I)
+
+
+def _classify_error(error: Any) -> Dict[str, bool]:
+    """Auth/rate-limit flags stored on each error record"""
+    text = str(error)
+    return {
+        "auth_error": bool(_AUTH_RE.search(text)),
+        "rate_error": bool(_RATE_RE.search(text)),
+    }
+
+
+def _epoch_to_iso(ts: float) -> str:
+    """Naive-UTC ISO timestamp for epoch seconds (the format stored on disk)."""
+    return datetime.fromtimestamp(ts, timezone.utc).replace(tzinfo=None).isoformat()
+
+
+def _iso_to_epoch(timestamp: Optional[str]) -> float:
+    """Epoch seconds for a naive-UTC ISO timestamp (0.0 if missing/invalid)."""
+    try:
+        return datetime.fromisoformat(timestamp).replace(tzinfo=timezone.utc).timestamp()
+    except (TypeError, ValueError):
+        return 0.0
+
+
 class PerformanceTracker:
     """
     Tracks performance metrics across all engines.
     Provides data for self-improvement decisions.
     """
     
+    # Rolling histories: bounded deques, so appends never slice-copy
+    HISTORY_LIMITS = {
+        "content_performance": 1000,
+        "error_history": 500,
+        "financial_history": 365,
+    }
+    
+    # Each history is an append-only JSONL file beside METRICS_FILE
+    HISTORY_FILES = {
+        "content_performance": "content_performance.jsonl",
+        "error_history": "errors.jsonl",
+        "financial_history": "financial.jsonl",
+    }
+    
+    # Hot content fields (with their .get defaults) mirrored column-wise,
+    # so per-cycle scans read one list instead of walking every record dict
+    CONTENT_COLUMNS = {
+        "ts": 0.0,
+        "platform": "unknown",
+        "engagement": 0,
+        "conversion_rate": 0,
+        "offer_id": None,
+        "clicks": 0,
+        "conversions": 0,
+        "upload_status": None,
+    }
+    
+    # Rewrite a history file once it holds this many times its retention cap
+    COMPACT_FACTOR = 2
+    
+    # Records are buffered and written in batches: every FLUSH_BATCH
+    # records or FLUSH_INTERVAL seconds, whichever comes first
+    FLUSH_BATCH = 50
+    FLUSH_INTERVAL = 5
+    
     def __init__(self):
         self.metrics_file = OmniConfig.METRICS_FILE
+        # Per-record weight kept by each niche's ewma_score
+        self.decay_rate = OmniConfig().IMPROVEMENT_PARAMS["performance_decay_rate"]
+        self._history_lines: Dict[str, int] = {}
         self.metrics = self._load_metrics()
+        self._columns = {
+            name: deque(
+                (record.get(name, default) for record in self.metrics["content_performance"]),
+                maxlen=self.HISTORY_LIMITS["content_performance"]
+            )
+            for name, default in self.CONTENT_COLUMNS.items()
+        }
         
+        # _flush_lock guards in-memory state and is only held briefly;
+        # _io_lock serializes the disk writes done outside it
+        self._flush_lock = threading.Lock()
+        self._io_lock = threading.RLock()
+        self._pending: Dict[str, List[bytes]] = {}
+        self._pending_count = 0
+        self._aggregates_dirty = False
+        self._flush_wake = threading.Event()
+        self._closed = False
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.close)
+        
+    def _history_path(self, key: str) -> Path:
+        return self.metrics_file.parent / self.HISTORY_FILES[key]
+    
     def _load_metrics(self) -> Dict:
         """Load historical metrics"""
-        if self.metrics_file.exists():
-            try:
-                with open(self.metrics_file, 'r') as f:
-                    return json.load(f)
-            except:
-                pass
-        
-        return {
+        metrics = {
             "content_performance": [],
             "niche_performance": {},
             "error_history": [],
             "financial_history": [],
             "optimization_history": []
         }
+        
+        if self.metrics_file.exists():
+            try:
+                metrics = _json_loads(self.metrics_file.read_bytes())
+            except:
+                pass
+        
+        for key, limit in self.HISTORY_LIMITS.items():
+            legacy = metrics.get(key) or []
+            path = self._history_path(key)
+            
+            if not path.exists():
+                # Older metrics files kept histories inline - migrate once
+                metrics[key] = deque(legacy, maxlen=limit)
+                if legacy:
+                    self._rewrite_history(key, metrics[key])
+                continue
+            
+            history = deque(maxlen=limit)
+            lines = 0
+            with open(path, 'rb') as f:
+                for line in f:
+                    try:
+                        history.append(_json_loads(line))
+                        lines += 1
+                    except ValueError:
+                        continue  # Blank or torn line from an interrupted write
+            metrics[key] = history
+            self._history_lines[key] = lines
+        
+        # Records from before epoch stamps: parse their ISO time once, here
+        for key in self.HISTORY_LIMITS:
+            for record in metrics[key]:
+                if "ts" not in record:
+                    record["ts"] = _iso_to_epoch(record.get("timestamp"))
+        for record in metrics["error_history"]:
+            if "auth_error" not in record:
+                record.update(_classify_error(record.get("error")))
+        
+        return metrics
+    
+    def _aggregates_json(self) -> bytes:
+        """Serialized aggregate metrics (histories live in their JSONL files)"""
+        data = {
+            key: value for key, value in self.metrics.items()
+            if key not in self.HISTORY_FILES
+        }
+        return _json_dumps(data, pretty=True, default=str)
     
-    def _save_metrics(self):
-        """Persist metrics to disk"""
+    def _save_metrics(self, payload: Optional[bytes] = None):
+        """Persist aggregate metrics"""
         self.metrics_file.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.metrics_file, 'w') as f:
-            json.dump(self.metrics, f, indent=2, default=str)
+        self.metrics_file.write_bytes(payload or self._aggregates_json())
+    
+    def _append_history(self, key: str, record: Dict):
+        """Add a record in memory and queue its JSONL line for the next flush."""
+        line = _json_dumps(record, default=str) + b"\n"
+        with self._flush_lock:
+            self.metrics[key].append(record)
+            if key == "content_performance":
+                for name, default in self.CONTENT_COLUMNS.items():
+                    self._columns[name].append(record.get(name, default))
+            self._pending.setdefault(key, []).append(line)
+            self._pending_count += 1
+            batch_full = self._pending_count >= self.FLUSH_BATCH
+        
+        if batch_full:
+            # Hand the write to the flush thread - callers may be on the event loop
+            self._flush_wake.set()
+    
+    def _flush_loop(self):
+        while not self._closed:
+            self._flush_wake.wait(self.FLUSH_INTERVAL)
+            self._flush_wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[OMNI] Metrics flush error: {e}")
+    
+    def flush(self):
+        """Write buffered history lines and dirty aggregates to disk."""
+        with self._io_lock:
+            # Take the buffers under the state lock; write without it
+            with self._flush_lock:
+                pending, self._pending = self._pending, {}
+                self._pending_count = 0
+                aggregates = None
+                if self._aggregates_dirty:
+                    self._aggregates_dirty = False
+                    aggregates = self._aggregates_json()
+            
+            for key, lines in pending.items():
+                path = self._history_path(key)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                with open(path, 'ab') as f:
+                    f.writelines(lines)
+                self._history_lines[key] = self._history_lines.get(key, 0) + len(lines)
+            
+            if aggregates is not None:
+                self._save_metrics(aggregates)
+            
+            self.compact_if_needed()
+    
+    def close(self):
+        """Stop the flush thread and write everything still buffered."""
+        if self._closed:
+            return
+        self._closed = True
+        self._flush_wake.set()
+        self._flush_thread.join()
+        self.flush()
+        atexit.unregister(self.close)
+    
+    def _rewrite_history(self, key: str, history: Sequence[Dict]):
+        """Replace a JSONL file with just the retained records."""
+        path = self._history_path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix(".tmp")
+        with open(tmp_path, 'wb') as f:
+            f.writelines(_json_dumps(record, default=str) + b"\n" for record in history)
+        os.replace(tmp_path, path)
+        self._history_lines[key] = len(history)
+    
+    def compact_if_needed(self):
+        """Truncate history files that have grown past their retention cap."""
+        with self._io_lock:
+            for key, limit in self.HISTORY_LIMITS.items():
+                if self._history_lines.get(key, 0) <= limit * self.COMPACT_FACTOR:
+                    continue
+                # The snapshot already holds any still-buffered lines for this
+                # key, so drop them; the rewrite itself runs without the lock
+                with self._flush_lock:
+                    snapshot = list(self.metrics[key])
+                    dropped = self._pending.pop(key, [])
+                    self._pending_count -= len(dropped)
+                self._rewrite_history(key, snapshot)
+    
+    def recent(self, key: str, count: int) -> List[Dict]:
+        """Last `count` records of a rolling history (oldest first)."""
+        history = self.metrics.get(key, ())
+        return list(islice(history, max(len(history) - count, 0), None))
+    
+    def recent_columns(self, count: int, *names: str) -> Tuple[List, ...]:
+        """Last `count` values of the named content columns, one list per name."""
+        with self._flush_lock:
+            start = max(len(self.metrics["content_performance"]) - count, 0)
+            return tuple(list(islice(self._columns[name], start, None)) for name in names)
     
     def record_content_performance(
         self,
@@ -186,8 +435,10 @@ class PerformanceTracker:
         conversions: int
     ):
         """Record content performance for learning"""
+        now = time.time()
         record = {
-            "timestamp": datetime.utcnow().isoformat(),
+            "ts": now,
+            "timestamp": _epoch_to_iso(now),
             "content_id": content_id,
             "niche": niche,
             "platform": platform,
@@ -197,103 +448,116 @@ class PerformanceTracker:
             "conversion_rate": conversions / max(views, 1)
         }
         
-        self.metrics["content_performance"].append(record)
-        
-        # Update niche performance
-        if niche not in self.metrics["niche_performance"]:
-            self.metrics["niche_performance"][niche] = {
-                "total_views": 0,
-                "total_conversions": 0,
-                "content_count": 0,
-                "avg_engagement": 0
-            }
-        
-        niche_data = self.metrics["niche_performance"][niche]
-        niche_data["total_views"] += views
-        niche_data["total_conversions"] += conversions
-        niche_data["content_count"] += 1
-        niche_data["avg_engagement"] = (
-            (niche_data["avg_engagement"] * (niche_data["content_count"] - 1) + engagement)
-            / niche_data["content_count"]
-        )
+        self._append_history("content_performance", record)
         
-        # Keep only last 1000 records
-        self.metrics["content_performance"] = self.metrics["content_performance"][-1000:]
-        self._save_metrics()
+        # Update niche performance (the flush thread may be serializing it)
+        with self._flush_lock:
+            if niche not in self.metrics["niche_performance"]:
+                self.metrics["niche_performance"][niche] = {
+                    "total_views": 0,
+                    "total_conversions": 0,
+                    "content_count": 0,
+                    "avg_engagement": 0
+                }
+            
+            niche_data = self.metrics["niche_performance"][niche]
+            if "ewma_score" not in niche_data:
+                niche_data["ewma_score"] = self._average_score(niche_data)
+            niche_data["total_views"] += views
+            niche_data["total_conversions"] += conversions
+            niche_data["content_count"] += 1
+            niche_data["avg_engagement"] = (
+                (niche_data["avg_engagement"] * (niche_data["content_count"] - 1) + engagement)
+                / niche_data["content_count"]
+            )
+            
+            # Same weights as the all-time average, but recent content counts more
+            score = engagement * 0.3 + conversions * 0.5 + (views / 10000) * 0.2
+            if niche_data["content_count"] == 1:
+                niche_data["ewma_score"] = score
+            else:
+                niche_data["ewma_score"] = (
+                    self.decay_rate * niche_data["ewma_score"] + (1 - self.decay_rate) * score
+                )
+            self._aggregates_dirty = True
     
     def record_error(self, component: str, error: str, context: Dict):
         """Record error for pattern analysis"""
-        self.metrics["error_history"].append({
-            "timestamp": datetime.utcnow().isoformat(),
+        now = time.time()
+        self._append_history("error_history", {
+            "ts": now,
+            "timestamp": _epoch_to_iso(now),
             "component": component,
             "error": error,
-            "context": context
+            "context": context,
+            **_classify_error(error)
         })
-        
-        # Keep only last 500 errors
-        self.metrics["error_history"] = self.metrics["error_history"][-500:]
-        self._save_metrics()
     
     def record_financial(self, revenue: float, cost: float, source: str):
         """Record financial data"""
-        self.metrics["financial_history"].append({
-            "timestamp": datetime.utcnow().isoformat(),
+        now = time.time()
+        self._append_history("financial_history", {
+            "ts": now,
+            "timestamp": _epoch_to_iso(now),
             "revenue": revenue,
             "cost": cost,
             "profit": revenue - cost,
             "source": source
         })
-        
-        # Keep only last 365 days
-        self.metrics["financial_history"] = self.metrics["financial_history"][-365:]
-        self._save_metrics()
+    
+    @staticmethod
+    def _average_score(data: Dict) -> float:
+        """All-time average score (seeds ewma_score for older metrics)."""
+        count = max(data["content_count"], 1)
+        return (
+            data["avg_engagement"] * 0.3 +
+            (data["total_conversions"] / count) * 0.5 +
+            (data["total_views"] / count / 10000) * 0.2
+        )
     
     def get_niche_rankings(self) -> List[tuple]:
-        """Get niches ranked by performance"""
-        rankings = []
-        
-        for niche, data in self.metrics.get("niche_performance", {}).items():
-            if data["content_count"] > 0:
-                score = (
-                    data["avg_engagement"] * 0.3 +
-                    (data["total_conversions"] / max(data["content_count"], 1)) * 0.5 +
-                    (data["total_views"] / max(data["content_count"], 1) / 10000) * 0.2
-                )
-                rankings.append((niche, score))
+        """Get niches ranked by recency-weighted performance"""
+        rankings = [
+            (niche, data.get("ewma_score", self._average_score(data)))
+            for niche, data in self.metrics.get("niche_performance", {}).items()
+            if data["content_count"] > 0
+        ]
         
         return sorted(rankings, key=lambda x: x[1], reverse=True)
     
     def get_error_patterns(self) -> Dict:
         """Analyze error patterns for self-healing"""
         patterns = {}
+        cutoff = time.time() - 86400
         recent_errors = [
             e for e in self.metrics.get("error_history", [])
-            if datetime.fromisoformat(e["timestamp"]) > datetime.utcnow() - timedelta(hours=24)
+            if e["ts"] > cutoff
         ]
         
         for error in recent_errors:
             component = error["component"]
             if component not in patterns:
-                patterns[component] = {"count": 0, "errors": []}
-            patterns[component]["count"] += 1
-            patterns[component]["errors"].append(error["error"])
+                patterns[component] = {"count": 0, "errors": [], "auth_hits": 0, "rate_hits": 0}
+            data = patterns[component]
+            data["count"] += 1
+            data["errors"].append(error["error"])
+            data["auth_hits"] += error["auth_error"]
+            data["rate_hits"] += error["rate_error"]
         
         return patterns
     
     def calculate_roi(self, days: int = 30) -> float:
         """Calculate ROI over specified period"""
-        cutoff = datetime.utcnow() - timedelta(days=days)
-        
-        recent = [
-            f for f in self.metrics.get("financial_history", [])
-            if datetime.fromisoformat(f["timestamp"]) > cutoff
-        ]
-        
-        if not recent:
+        cutoff = time.time() - days * 86400
+        history = self.metrics.get("financial_history", [])
+        
+        rows = np.array(
+            [(f["ts"], f["revenue"], f["cost"]) for f in history], dtype=np.float64
+        ).reshape(-1, 3)
+        recent = rows[rows[:, 0] > cutoff]
+        if not len(recent):
             return 0.0
-        
-        total_revenue = sum(f["revenue"] for f in recent)
-        total_cost = sum(f["cost"] for f in recent)
+        total_revenue, total_cost = float(recent[:, 1].sum()), float(recent[:, 2].sum())
         
         if total_cost == 0:
             return float('inf') if total_revenue > 0 else 0.0
@@ -305,6 +569,7 @@ class PerformanceTracker:
 # SELF-HEALER - The Immune System
 # ============================================================
 
+
 class SelfHealer:
     """
     Automatic self-healing system.
@@ -316,8 +581,8 @@ class SelfHealer:
         self.tracker = tracker
         self.healing_log = []
         
-    async def diagnose_system(self) -> Dict:
-        """Full system diagnosis"""
+    async def diagnose_system(self, patterns: Optional[Dict] = None) -> Dict:
+        """Full system diagnosis (pass `patterns` to reuse a cycle's snapshot)"""
         diagnosis = {
             "timestamp": datetime.utcnow().isoformat(),
             "issues": [],
@@ -326,7 +591,8 @@ class SelfHealer:
         }
         
         # Check error patterns
-        patterns = self.tracker.get_error_patterns()
+        if patterns is None:
+            patterns = self.tracker.get_error_patterns()
         
         for component, data in patterns.items():
             if data["count"] >= OmniConfig.HEALING_TRIGGERS["consecutive_failures"]:
@@ -358,13 +624,15 @@ class SelfHealer:
     async def heal(self, diagnosis: Dict) -> Dict:
         """Apply healing procedures based on diagnosis"""
         actions_taken = []
+        # Actions are logged under the diagnosis' cycle timestamp
+        timestamp = diagnosis.get("timestamp") or datetime.utcnow().isoformat()
         
         for issue in diagnosis.get("issues", []):
             action = await self._apply_healing(issue)
             if action:
                 actions_taken.append(action)
                 self.healing_log.append({
-                    "timestamp": datetime.utcnow().isoformat(),
+                    "timestamp": timestamp,
                     "issue": issue,
                     "action": action
                 })
@@ -394,7 +662,7 @@ class SelfHealer:
             errors = issue.get("sample_errors", [])
             
             # Check for rate limiting
-            if any("rate" in str(e).lower() for e in errors):
+            if any(_RATE_RE.search(str(e)) for e in errors):
                 return {
                     "action": "reduce_frequency",
                     "component": component,
@@ -402,7 +670,7 @@ class SelfHealer:
                 }
             
             # Check for auth issues
-            if any("auth" in str(e).lower() or "401" in str(e) for e in errors):
+            if any(_AUTH_RE.search(str(e)) for e in errors):
                 await self.survivor.alert_manager.alert(
                     f"🔐 Auth issue detected in {component}. Manual refresh needed.",
                     "critical"
@@ -424,7 +692,7 @@ class SelfHealer:
     
     async def run_healing_cycle(self) -> Dict:
         """Run a complete healing cycle"""
-        diagnosis = await self.diagnose_system()
+        diagnosis = await self.diagnose_system(self.tracker.get_error_patterns())
         
         if diagnosis["issues"]:
             healing_result = await self.heal(diagnosis)
@@ -455,14 +723,37 @@ class SelfFixer:
         self.tracker = tracker
         self.config = OmniConfig()
         self.fix_history = []
-        self.fix_cooldowns = {}  # {fix_type: last_attempt_time}
+        # Cooling fix types: a min-heap of (time.monotonic() when allowed
+        # again, fix_type) plus a set for O(1) membership checks
+        self._cooldown_heap: List[Tuple[float, str]] = []
+        self._cooling = set()
+        # Repair loop interval: doubles on each clean cycle, resets on issues
+        self._next_sleep = self.config.FIX_PARAMS["repair_interval_seconds"]
         
     async def scan_for_fixable_issues(self) -> List[Dict]:
         """Scan system for issues that can be auto-fixed"""
+        self._expire_cooldowns()
         issues = []
+        # One error-pattern snapshot shared by the auth and rate-limit checks
+        patterns = self.tracker.get_error_patterns()
+        
+        # The checks touch independent subsystems - run them concurrently
+        results = await asyncio.gather(
+            self._check_oauth_tokens(patterns),
+            self._check_storage(),
+            self._check_failed_uploads(),
+            self._check_affiliate_offers(),
+            asyncio.to_thread(self._check_rate_limits, patterns),
+            return_exceptions=True
+        )
+        for name, result in zip(("oauth", "storage", "uploads", "offers", "rate_limits"), results):
+            if isinstance(result, Exception):
+                print(f"[OMNI] Fix scan check '{name}' failed: {result}")
+        oauth_status, storage_status, failed_uploads, offer_status, rate_limit_status = (
+            {} if isinstance(r, Exception) else r for r in results
+        )
         
         # 1. Check for stale OAuth tokens
-        oauth_status = await self._check_oauth_tokens()
         if oauth_status.get("needs_refresh"):
             issues.append({
                 "type": "oauth_expired",
@@ -472,7 +763,6 @@ class SelfFixer:
             })
         
         # 2. Check for full temp storage
-        storage_status = await self._check_storage()
         if storage_status.get("temp_full"):
             issues.append({
                 "type": "temp_storage_full",
@@ -482,7 +772,6 @@ class SelfFixer:
             })
         
         # 3. Check for failed uploads pending retry
-        failed_uploads = await self._check_failed_uploads()
         if failed_uploads:
             issues.append({
                 "type": "failed_uploads_pending",
@@ -493,7 +782,6 @@ class SelfFixer:
             })
         
         # 4. Check for underperforming affiliate offers
-        offer_status = await self._check_affiliate_offers()
         if offer_status.get("needs_rotation"):
             issues.append({
                 "type": "underperforming_offers",
@@ -503,7 +791,6 @@ class SelfFixer:
             })
         
         # 5. Check for API rate limit issues
-        rate_limit_status = self._check_rate_limits()
         if rate_limit_status.get("throttled"):
             issues.append({
                 "type": "rate_limited",
@@ -514,15 +801,14 @@ class SelfFixer:
         
         return issues
     
-    async def _check_oauth_tokens(self) -> Dict:
+    async def _check_oauth_tokens(self, patterns: Optional[Dict] = None) -> Dict:
         """Check OAuth token validity"""
         # Check error patterns for auth-related issues
-        patterns = self.tracker.get_error_patterns()
+        if patterns is None:
+            patterns = self.tracker.get_error_patterns()
         
         for component, data in patterns.items():
-            errors = data.get("errors", [])
-            auth_errors = [e for e in errors if "401" in str(e) or "auth" in str(e).lower()]
-            if len(auth_errors) >= 2:
+            if data["auth_hits"] >= 2:
                 return {"needs_refresh": True, "component": component}
         
         return {"needs_refresh": False}
@@ -534,7 +820,7 @@ class SelfFixer:
         temp_path = Path("/data/temp")
         if temp_path.exists():
             try:
-                total, used, free = shutil.disk_usage(temp_path)
+                total, used, free = await asyncio.to_thread(shutil.disk_usage, temp_path)
                 used_percent = (used / total) * 100
                 
                 return {
@@ -550,10 +836,12 @@ class SelfFixer:
     async def _check_failed_uploads(self) -> List[Dict]:
         """Check for failed uploads that can be retried"""
         # Look for failed upload records in metrics
-        failed = []
-        content_data = self.tracker.metrics.get("content_performance", [])
+        statuses, = self.tracker.recent_columns(50, "upload_status")
+        if "failed" not in statuses:
+            return []
         
-        for content in content_data[-50:]:
+        failed = []
+        for content in self.tracker.recent("content_performance", 50):
             if content.get("upload_status") == "failed":
                 failed.append({
                     "content_id": content.get("content_id"),
@@ -566,39 +854,35 @@ class SelfFixer:
     async def _check_affiliate_offers(self) -> Dict:
         """Check affiliate offer performance"""
         # Analyze conversion data
-        content_data = self.tracker.metrics.get("content_performance", [])
-        
-        offer_performance = {}
-        for content in content_data[-100:]:
-            offer_id = content.get("offer_id")
-            if offer_id:
-                if offer_id not in offer_performance:
-                    offer_performance[offer_id] = {"clicks": 0, "conversions": 0}
-                offer_performance[offer_id]["clicks"] += content.get("clicks", 0)
-                offer_performance[offer_id]["conversions"] += content.get("conversions", 0)
+        offer_ids, clicks, conversions = self.tracker.recent_columns(
+            100, "offer_id", "clicks", "conversions"
+        )
+        offered = [i for i, offer_id in enumerate(offer_ids) if offer_id]
+        offer_performance = _group_totals(
+            [offer_ids[i] for i in offered],
+            [clicks[i] for i in offered],
+            [conversions[i] for i in offered]
+        )
         
         # Find underperformers (< 0.5% conversion rate with significant traffic)
-        needs_rotation = []
-        for offer_id, data in offer_performance.items():
-            if data["clicks"] >= 100:
-                conv_rate = data["conversions"] / data["clicks"]
-                if conv_rate < 0.005:  # < 0.5%
-                    needs_rotation.append(offer_id)
+        needs_rotation = [
+            offer_id for offer_id, (_, clicks, conversions) in offer_performance.items()
+            if clicks >= 100 and conversions / clicks < 0.005  # < 0.5%
+        ]
         
         return {
             "needs_rotation": len(needs_rotation) > 0,
             "offers": needs_rotation
         }
     
-    def _check_rate_limits(self) -> Dict:
+    def _check_rate_limits(self, patterns: Optional[Dict] = None) -> Dict:
         """Check for rate limit issues in error patterns"""
-        patterns = self.tracker.get_error_patterns()
+        if patterns is None:
+            patterns = self.tracker.get_error_patterns()
         throttled_apis = []
         
         for component, data in patterns.items():
-            errors = data.get("errors", [])
-            rate_errors = [e for e in errors if "429" in str(e) or "rate" in str(e).lower()]
-            if len(rate_errors) >= 2:
+            if data["rate_hits"] >= 2:
                 throttled_apis.append(component)
         
         return {
@@ -606,19 +890,27 @@ class SelfFixer:
             "apis": throttled_apis
         }
     
+    def _expire_cooldowns(self):
+        """Release fix types whose cooldown has elapsed"""
+        now = time.monotonic()
+        while self._cooldown_heap and self._cooldown_heap[0][0] <= now:
+            _, fix_type = heapq.heappop(self._cooldown_heap)
+            self._cooling.discard(fix_type)
+    
+    def _start_cooldown(self, fix_type: str):
+        """Put a fix type on cooldown from now"""
+        cooldown = self.config.FIX_PARAMS["fix_cooldown_seconds"]
+        heapq.heappush(self._cooldown_heap, (time.monotonic() + cooldown, fix_type))
+        self._cooling.add(fix_type)
+    
     def _can_apply_fix(self, fix_type: str) -> bool:
         """Check if fix is off cooldown"""
-        cooldown = self.config.FIX_PARAMS["fix_cooldown_seconds"]
-        last_attempt = self.fix_cooldowns.get(fix_type)
-        
-        if last_attempt:
-            elapsed = (datetime.utcnow() - last_attempt).total_seconds()
-            return elapsed >= cooldown
-        
-        return True
+        # Only touches the heap when its head has expired
+        self._expire_cooldowns()
+        return fix_type not in self._cooling
     
-    async def apply_fix(self, issue: Dict) -> Dict:
-        """Apply a fix for a specific issue"""
+    async def apply_fix(self, issue: Dict, timestamp: Optional[str] = None) -> Dict:
+        """Apply a fix for a specific issue (`timestamp`: the cycle's ISO time)"""
         issue_type = issue.get("type")
         
         if not self._can_apply_fix(issue_type):
@@ -643,9 +935,9 @@ class SelfFixer:
                 result = await self._fix_offers(issue.get("offers", []))
             
             # Record fix attempt
-            self.fix_cooldowns[issue_type] = datetime.utcnow()
+            self._start_cooldown(issue_type)
             self.fix_history.append({
-                "timestamp": datetime.utcnow().isoformat(),
+                "timestamp": timestamp or datetime.utcnow().isoformat(),
                 "issue": issue,
                 "result": result
             })
@@ -655,30 +947,44 @@ class SelfFixer:
         
         return result
     
-    async def _fix_storage(self) -> Dict:
-        """Clear temp storage"""
+    @staticmethod
+    def _sweep_temp(temp_path: Path, cutoff: float) -> int:
+        """Remove temp entries last modified before `cutoff` (blocking)"""
         import shutil
         
-        temp_path = Path("/data/temp")
         files_removed = 0
-        
-        if temp_path.exists():
-            for item in temp_path.iterdir():
+        try:
+            it = os.scandir(temp_path)
+        except OSError:
+            return 0
+        
+        # scandir hands back d_type with each entry, so is_file/is_dir
+        # need no extra syscall and only stat() touches the inode
+        with it:
+            for entry in it:
                 try:
-                    if item.is_file():
-                        # Only remove files older than 1 hour
-                        age = datetime.utcnow().timestamp() - item.stat().st_mtime
-                        if age > 3600:
-                            item.unlink()
-                            files_removed += 1
-                    elif item.is_dir():
-                        age = datetime.utcnow().timestamp() - item.stat().st_mtime
-                        if age > 3600:
-                            shutil.rmtree(item)
-                            files_removed += 1
+                    if entry.stat().st_mtime >= cutoff:
+                        continue
+                    if entry.is_file():
+                        os.unlink(entry.path)
+                        files_removed += 1
+                    elif entry.is_dir():
+                        shutil.rmtree(entry.path)
+                        files_removed += 1
                 except:
                     pass
         
+        return files_removed
+    
+    async def _fix_storage(self) -> Dict:
+        """Clear temp storage"""
+        temp_path = Path("/data/temp")
+        # Only remove entries older than 1 hour
+        cutoff = time.time() - 3600
+        
+        # Filesystem walk runs off the event loop
+        files_removed = await asyncio.to_thread(self._sweep_temp, temp_path, cutoff)
+        
         await self.survivor.alert_manager.alert(
             f"🧹 Auto-fixed: Cleared {files_removed} old temp files",
             "info"
@@ -735,19 +1041,33 @@ class SelfFixer:
         
         return {"fixed": True, "offers_flagged": rotated}
     
+    def note_issues(self, found: bool):
+        """Back off the repair interval after a clean cycle; snap back on issues"""
+        if found:
+            self._next_sleep = self.config.FIX_PARAMS["repair_interval_seconds"]
+        else:
+            self._next_sleep = min(
+                self._next_sleep * 2, self.config.FIX_PARAMS["max_repair_interval_seconds"]
+            )
+    
+    def next_interval(self) -> float:
+        """Seconds the repair loop should wait before its next cycle"""
+        return self._next_sleep
+    
     async def run_fix_cycle(self) -> Dict:
         """Run a complete fix cycle"""
+        timestamp = datetime.utcnow().isoformat()
         issues = await self.scan_for_fixable_issues()
         
         fixes_applied = []
         for issue in issues:
             if issue.get("auto_fixable"):
-                result = await self.apply_fix(issue)
+                result = await self.apply_fix(issue, timestamp)
                 if result.get("fixed"):
                     fixes_applied.append(result)
         
         return {
-            "timestamp": datetime.utcnow().isoformat(),
+            "timestamp": timestamp,
             "issues_found": len(issues),
             "fixes_applied": len(fixes_applied),
             "details": fixes_applied
@@ -849,20 +1169,16 @@ class SelfImprover:
             return None
         
         # Group by hour and calculate average engagement
-        hour_performance = {}
-        for content in content_data[-100:]:
-            try:
-                hour = datetime.fromisoformat(content["timestamp"]).hour
-                if hour not in hour_performance:
-                    hour_performance[hour] = []
-                hour_performance[hour].append(content.get("engagement", 0))
-            except:
-                pass
+        stamps, engagement = self.tracker.recent_columns(100, "ts", "engagement")
+        hour_performance = _group_totals(
+            [int(ts // 3600) % 24 for ts in stamps],  # UTC hour
+            engagement
+        )
         
         # Find best hours
         best_hours = sorted(
             hour_performance.items(),
-            key=lambda x: sum(x[1]) / len(x[1]) if x[1] else 0,
+            key=lambda x: x[1][1] / x[1][0],
             reverse=True
         )[:3]
         
@@ -883,17 +1199,13 @@ class SelfImprover:
             return None
         
         # Analyze platform performance
-        platform_performance = {}
-        for content in content_data[-50:]:
-            platform = content.get("platform", "unknown")
-            if platform not in platform_performance:
-                platform_performance[platform] = []
-            platform_performance[platform].append(content.get("conversion_rate", 0))
+        platform_performance = _group_totals(
+            *self.tracker.recent_columns(50, "platform", "conversion_rate")
+        )
         
         # Calculate averages
         platform_avg = {
-            p: sum(rates) / len(rates) if rates else 0
-            for p, rates in platform_performance.items()
+            p: total / count for p, (count, total) in platform_performance.items()
         }
         
         best_platform = max(platform_avg, key=platform_avg.get) if platform_avg else None
@@ -1060,9 +1372,10 @@ class OmniOrchestrator:
         """
         self.system_state = SystemState.RUNNING
         
+        started = datetime.utcnow()
         cycle_result = {
-            "cycle_id": f"cycle_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}",
-            "timestamp": datetime.utcnow().isoformat(),
+            "cycle_id": f"cycle_{started.strftime('%Y%m%d_%H%M%S')}",
+            "timestamp": started.isoformat(),
             "phases": {}
         }
         
@@ -1296,6 +1609,29 @@ class OmniOrchestrator:
             "health": await self.survivor.get_system_status()
         }
     
+    async def run_repair_loop(self, max_cycles: Optional[int] = None):
+        """Heal and fix continuously, sleeping longer while nothing is wrong"""
+        cycles = 0
+        while max_cycles is None or cycles < max_cycles:
+            cycles += 1
+            try:
+                healing = await self.healer.run_healing_cycle()
+                fixing = await self.fixer.run_fix_cycle()
+                self.fixer.note_issues(
+                    bool(healing["diagnosis"]["issues"]) or fixing["issues_found"] > 0
+                )
+                
+                print(f"[OMNI] Repair cycle {cycles}: "
+                      f"{len(healing['diagnosis']['issues'])} healer issues, "
+                      f"{fixing['issues_found']} fixer issues, "
+                      f"next check in {self.fixer.next_interval()}s")
+            except Exception as e:
+                # A failing cycle is itself a problem - check again soon
+                self.fixer.note_issues(True)
+                print(f"[OMNI] Repair cycle {cycles} error: {e}")
+            
+            await asyncio.sleep(self.fixer.next_interval())
+    
     async def emergency_fix(self) -> Dict:
         """Emergency fix cycle - run all self-repair systems"""
         self.system_state = SystemState.CRITICAL
@@ -1352,6 +1688,9 @@ if __name__ == "__main__":
                 result = orchestrator.improver.analyze_and_improve()
             elif command == "emergency":
                 result = await orchestrator.emergency_fix()
+            elif command == "repair":
+                await orchestrator.run_repair_loop()
+                return
             elif command == "help":
                 result = {
                     "commands": {
@@ -1363,6 +1702,7 @@ if __name__ == "__main__":
                         "fix": "Run self-fixing cycle only",
                         "improve": "Run self-improvement analysis",
                         "emergency": "Execute emergency fix (all repair systems)",
+                        "repair": "Run heal + fix continuously with idle backoff",
                         "help": "Show this help message"
                     }
                 }
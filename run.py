@@ -590,6 +590,13 @@ async def run_continuous_mode(max_cycles: int = 0):
 
 
 if __name__ == "__main__":
+    # libuv event loop when available (not on Windows)
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+    
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
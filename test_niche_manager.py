@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""
+Niche orchestrator persistence test.
+Runs one routed upload and checks the counters reached the config on disk.
+"""
+import asyncio
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from engines.niche_manager import MasterNicheOrchestrator
+
+
+def test_distribute_content_persists_counters(tmp_path):
+    config_path = tmp_path / "niche_config.json"
+    orchestrator = MasterNicheOrchestrator(str(config_path))
+
+    result = asyncio.run(orchestrator.distribute_content(
+        "video.mp4", "Title", "Description", ["survival tips"], ["x"]
+    ))
+
+    assert result["success"]
+    saved = json.loads(config_path.read_text())
+    assert saved["survival"]["total_videos"] == 1
+
+
+def test_concurrent_uploads_share_saves(tmp_path):
+    config_path = tmp_path / "niche_config.json"
+    orchestrator = MasterNicheOrchestrator(str(config_path))
+    
+    saves = []
+    save_config = orchestrator.save_config
+    orchestrator.save_config = lambda: (saves.append(1), save_config())
+    
+    async def upload_many():
+        return await asyncio.gather(*(
+            orchestrator.distribute_content(
+                "video.mp4", "Title", "Description", ["survival tips"], ["x"]
+            )
+            for _ in range(5)
+        ))
+    
+    results = asyncio.run(upload_many())
+    
+    assert all(result["success"] for result in results)
+    raw = config_path.read_text()
+    assert raw.startswith("{\n")  # Indented format kept
+    assert json.loads(raw)["survival"]["total_videos"] == 5
+    assert len(saves) < 5
+    assert not (tmp_path / "niche_config.json.tmp").exists()
+
+
+if __name__ == "__main__":
+    with tempfile.TemporaryDirectory() as tmp:
+        test_distribute_content_persists_counters(Path(tmp))
+    with tempfile.TemporaryDirectory() as tmp:
+        test_concurrent_uploads_share_saves(Path(tmp))
+    print("[NICHE TEST] OK")